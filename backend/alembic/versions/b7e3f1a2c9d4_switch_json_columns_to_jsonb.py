@@ -0,0 +1,99 @@
+"""switch json and json-in-text columns to jsonb
+
+Revision ID: b7e3f1a2c9d4
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3f1a2c9d4'
+down_revision: Union[str, None] = 'a1b2c3d4e5f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_MINI_JSON_COLUMNS = (
+    'knowledge_graph_json',
+    'principles_json',
+    'values_json',
+    'roles_json',
+    'skills_json',
+    'traits_json',
+    'metadata_json',
+    'sources_used',
+)
+
+# JSONB rejects \u0000 escapes (valid in json and text) and the TEXT columns
+# may hold rows that never were valid JSON. Cast as-is when possible, retry
+# with the NUL escapes stripped, and give up with NULL otherwise.
+_CREATE_LENIENT_CAST = r"""
+CREATE FUNCTION pg_temp.to_jsonb_lenient(value text) RETURNS jsonb AS $$
+BEGIN
+    RETURN value::jsonb;
+EXCEPTION WHEN others THEN
+    BEGIN
+        RETURN replace(value, '\u0000', '')::jsonb;
+    EXCEPTION WHEN others THEN
+        RETURN NULL;
+    END;
+END
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.execute(_CREATE_LENIENT_CAST)
+
+    # minis: JSON -> JSONB
+    for column in _MINI_JSON_COLUMNS:
+        op.alter_column('minis', column,
+                        existing_type=sa.JSON(),
+                        type_=postgresql.JSONB(),
+                        existing_nullable=True,
+                        postgresql_using=f'pg_temp.to_jsonb_lenient({column}::text)')
+
+    # ingestion_data / mini_revisions: JSON stored as TEXT -> JSONB.
+    # data_json is NOT NULL; unreadable cache rows are dropped and refetched.
+    op.execute('DELETE FROM ingestion_data '
+               'WHERE pg_temp.to_jsonb_lenient(data_json) IS NULL')
+    op.alter_column('ingestion_data', 'data_json',
+                    existing_type=sa.Text(),
+                    type_=postgresql.JSONB(),
+                    existing_nullable=False,
+                    postgresql_using='pg_temp.to_jsonb_lenient(data_json)')
+    op.alter_column('mini_revisions', 'values_json',
+                    existing_type=sa.Text(),
+                    type_=postgresql.JSONB(),
+                    existing_nullable=True,
+                    postgresql_using='pg_temp.to_jsonb_lenient(values_json)')
+
+    op.execute('DROP FUNCTION pg_temp.to_jsonb_lenient(text)')
+
+
+def downgrade() -> None:
+    # Lossy: the upgrade stripped \u0000 escapes, NULLed values that were not
+    # valid JSON and deleted such ingestion_data rows. None of that comes back.
+    op.alter_column('mini_revisions', 'values_json',
+                    existing_type=postgresql.JSONB(),
+                    type_=sa.Text(),
+                    existing_nullable=True,
+                    postgresql_using='values_json::text')
+    op.alter_column('ingestion_data', 'data_json',
+                    existing_type=postgresql.JSONB(),
+                    type_=sa.Text(),
+                    existing_nullable=False,
+                    postgresql_using='data_json::text')
+
+    for column in reversed(_MINI_JSON_COLUMNS):
+        op.alter_column('minis', column,
+                        existing_type=postgresql.JSONB(),
+                        type_=sa.JSON(),
+                        existing_nullable=True,
+                        postgresql_using=f'{column}::json')
@@ -0,0 +1,33 @@
+"""add lookup indexes for minis.owner_id and ingestion_data.expires_at
+
+Revision ID: c4d8e2f6a1b3
+Revises: b7e3f1a2c9d4
+Create Date: 2026-10-16 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d8e2f6a1b3'
+down_revision: Union[str, None] = 'b7e3f1a2c9d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index('ix_ingestion_expires', 'ingestion_data', ['expires_at'],
+                        unique=False, postgresql_concurrently=True)
+        op.create_index('ix_mini_owner', 'minis', ['owner_id'],
+                        unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_mini_owner', table_name='minis', postgresql_concurrently=True)
+        op.drop_index('ix_ingestion_expires', table_name='ingestion_data',
+                      postgresql_concurrently=True)
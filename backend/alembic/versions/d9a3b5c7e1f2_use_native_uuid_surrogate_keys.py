@@ -0,0 +1,44 @@
+"""use native uuid for usage, budget and settings surrogate keys
+
+Revision ID: d9a3b5c7e1f2
+Revises: c4d8e2f6a1b3
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a3b5c7e1f2'
+down_revision: Union[str, None] = 'c4d8e2f6a1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_TABLES = (
+    'llm_usage_events',
+    'user_budgets',
+    'global_budget',
+    'user_settings',
+)
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.alter_column(table, 'id',
+                        existing_type=sa.String(length=36),
+                        type_=sa.Uuid(),
+                        existing_nullable=False,
+                        postgresql_using='id::uuid')
+
+
+def downgrade() -> None:
+    for table in reversed(_TABLES):
+        op.alter_column(table, 'id',
+                        existing_type=sa.Uuid(),
+                        type_=sa.String(length=36),
+                        existing_nullable=False,
+                        postgresql_using='id::text')
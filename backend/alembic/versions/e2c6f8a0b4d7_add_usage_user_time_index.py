@@ -0,0 +1,35 @@
+"""replace llm_usage_events user_id index with (user_id, created_at)
+
+Revision ID: e2c6f8a0b4d7
+Revises: d9a3b5c7e1f2
+Create Date: 2026-10-16 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2c6f8a0b4d7'
+down_revision: Union[str, None] = 'd9a3b5c7e1f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index('ix_usage_user_time', 'llm_usage_events', ['user_id', 'created_at'],
+                        unique=False, postgresql_concurrently=True)
+        # The composite index's leading column covers plain user_id lookups
+        op.drop_index('ix_llm_usage_events_user_id', table_name='llm_usage_events',
+                      postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_llm_usage_events_user_id', 'llm_usage_events', ['user_id'],
+                        unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_usage_user_time', table_name='llm_usage_events',
+                      postgresql_concurrently=True)
@@ -50,7 +50,7 @@ def _resolve_tool_choice(strategy: str, turn: int) -> str:
     return "required" if turn == 0 else "auto"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentTool:
     """A tool the agent can call."""
 
@@ -60,7 +60,7 @@ class AgentTool:
     handler: Any  # async callable(kwargs) -> str
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentResult:
     """Result of an agent run."""
 
@@ -353,7 +353,7 @@ async def _fallback_no_tools(
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentEvent:
     """An event from the agent streaming loop."""
     type: str  # "tool_call", "tool_result", "chunk", "done", "error"
@@ -64,6 +64,12 @@ class Settings(BaseSettings):
     # Admin
     admin_usernames: str = "alliecatowo"  # comma-separated
 
+    # Re-validate JSON the pipeline already wrote to the DB when building responses
+    validate_cached_json: bool = False
+
+    # Where parsed Claude Code transcripts are cached; empty = $XDG_CACHE_HOME/minis/claude_code
+    claude_code_parse_cache_dir: str = ""
+
     # Promo mini (anonymous chat allowed)
     promo_mini_username: str = "alliecatowo"
 
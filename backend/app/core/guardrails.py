@@ -56,7 +56,7 @@ _MAX_INPUT_TOKENS = 8_000  # Warn threshold for a single user message
 _MAX_HISTORY_TOKENS = 32_000  # Warn threshold for total conversation history
 
 
-@dataclass
+@dataclass(slots=True)
 class GuardrailResult:
     """Result of running guardrail checks on a message."""
 
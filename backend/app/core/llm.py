@@ -40,6 +40,9 @@ async def _check_budget(user_id: str | None) -> None:
 
     Raises BudgetExceededError if the budget is exhausted.
     Does nothing if user_id is None (unauthenticated/system calls).
+
+    Spend is recorded through ``usage_buffer``, so the totals read here can lag
+    by up to one flush interval; concurrent calls may overspend by one batch.
     """
     if user_id is None:
         return
@@ -74,7 +77,7 @@ async def _check_budget(user_id: str | None) -> None:
         logger.debug("Budget check failed (non-blocking)", exc_info=True)
 
 
-async def _record_usage(
+def _record_usage(
     user_id: str | None,
     model: str,
     input_tokens: int,
@@ -83,84 +86,28 @@ async def _record_usage(
     endpoint: str | None = None,
     error: str | None = None,
 ) -> None:
-    """Record an LLM usage event to the database.
+    """Queue an LLM usage event for the batched usage writer.
 
-    Never raises -- failures are logged and swallowed so metering
-    does not break the caller.
+    The event row and the user/global budget totals are written by
+    app.core.usage_buffer on its next flush. Never raises -- failures are
+    logged and swallowed so metering does not break the caller.
     """
     try:
-        from app.core.alerts import (
-            alert_budget_threshold,
-            alert_expensive_request,
-            alert_global_threshold,
-        )
-        from app.db import async_session
-        from app.models.usage import GlobalBudget, LLMUsageEvent, UserBudget
-
-        async with async_session() as session:
-            # 1. Write the usage event
-            event = LLMUsageEvent(
-                user_id=user_id,
-                model=model,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                total_tokens=input_tokens + output_tokens,
-                cost_usd=cost_usd,
-                endpoint=endpoint,
-                error=error,
-            )
-            session.add(event)
-
-            # 2. Update user budget running total
-            if user_id:
-                from sqlalchemy import select
-
-                result = await session.execute(
-                    select(UserBudget).where(UserBudget.user_id == user_id)
-                )
-                user_budget = result.scalar_one_or_none()
-                if user_budget is None:
-                    user_budget = UserBudget(user_id=user_id)
-                    session.add(user_budget)
-                    await session.flush()
-                user_budget.total_spent_usd += cost_usd
-
-                # Alert at 80% threshold
-                if user_budget.monthly_budget_usd > 0:
-                    pct = user_budget.total_spent_usd / user_budget.monthly_budget_usd
-                    if pct >= 0.8:
-                        alert_budget_threshold(
-                            user_id,
-                            user_budget.total_spent_usd,
-                            user_budget.monthly_budget_usd,
-                            pct,
-                        )
-
-            # 3. Update global budget running total
-            from sqlalchemy import select
-
-            result = await session.execute(
-                select(GlobalBudget).where(GlobalBudget.key == "global")
-            )
-            global_budget = result.scalar_one_or_none()
-            if global_budget is None:
-                global_budget = GlobalBudget()
-                session.add(global_budget)
-                await session.flush()
-            global_budget.total_spent_usd += cost_usd
-
-            if global_budget.monthly_budget_usd > 0:
-                pct = global_budget.total_spent_usd / global_budget.monthly_budget_usd
-                if pct >= 0.8:
-                    alert_global_threshold(
-                        global_budget.total_spent_usd,
-                        global_budget.monthly_budget_usd,
-                        pct,
-                    )
-
-            await session.commit()
-
-        # 4. Alert on expensive single requests
+        from app.core.alerts import alert_expensive_request
+        from app.core.usage_buffer import usage_buffer
+
+        usage_buffer.add({
+            "user_id": user_id,
+            "model": model,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+            "cost_usd": cost_usd,
+            "endpoint": endpoint,
+            "error": error,
+        })
+
+        # Alert on expensive single requests
         if cost_usd > 0.50:
             alert_expensive_request(
                 user_id, model, cost_usd, input_tokens + output_tokens
@@ -203,7 +150,7 @@ async def llm_completion(
     from app.core.pricing import calculate_cost
 
     cost = calculate_cost(model, input_tokens, output_tokens)
-    await _record_usage(user_id, model, input_tokens, output_tokens, cost, endpoint="llm_completion")
+    _record_usage(user_id, model, input_tokens, output_tokens, cost, endpoint="llm_completion")
 
     return response.choices[0].message.content
 
@@ -237,7 +184,7 @@ async def llm_completion_json(
     from app.core.pricing import calculate_cost
 
     cost = calculate_cost(model, input_tokens, output_tokens)
-    await _record_usage(user_id, model, input_tokens, output_tokens, cost, endpoint="llm_completion_json")
+    _record_usage(user_id, model, input_tokens, output_tokens, cost, endpoint="llm_completion_json")
 
     return response.choices[0].message.content
 
@@ -283,4 +230,4 @@ async def llm_stream(
     from app.core.pricing import calculate_cost
 
     cost = calculate_cost(model, input_tokens, output_tokens)
-    await _record_usage(user_id, model, input_tokens, output_tokens, cost, endpoint="llm_stream")
+    _record_usage(user_id, model, input_tokens, output_tokens, cost, endpoint="llm_stream")
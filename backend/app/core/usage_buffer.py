@@ -0,0 +1,168 @@
+"""Batched writer for LLM usage metering.
+
+Every LLM call produces one usage event plus a bump to the caller's and the
+platform's running budget totals. Writing those through the ORM one call at a
+time costs a session, two SELECTs and a commit per call. Instead, events are
+queued here as plain dicts and flushed in batches: one executemany INSERT for
+the events and one upsert each for the user and global budget totals.
+
+The flusher is started in the app lifespan and drained on shutdown. Budget
+totals therefore trail reality by up to one flush interval (or one batch):
+budget checks read the stored totals, so a caller can overspend by whatever
+is still queued here.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL_SECONDS = 0.25
+FLUSH_BATCH_SIZE = 100
+
+
+class UsageEventBuffer:
+    """Accumulates usage events in memory and flushes them in batches."""
+
+    def __init__(
+        self,
+        interval: float = FLUSH_INTERVAL_SECONDS,
+        batch_size: int = FLUSH_BATCH_SIZE,
+    ) -> None:
+        self._interval = interval
+        self._batch_size = batch_size
+        self._pending: list[dict[str, Any]] = []
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._direct_flush: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the background flusher. Must be called from a running event loop."""
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    def add(self, event: dict[str, Any]) -> None:
+        """Queue a usage event row for the next flush."""
+        self._pending.append(event)
+        if self._task is not None and not self._task.done():
+            if len(self._pending) >= self._batch_size:
+                self._wakeup.set()
+            return
+
+        # Flusher not running (scripts, tests, calls outside the app lifespan):
+        # write directly instead of letting events pile up unflushed.
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning(
+                "Usage event queued with no running event loop; %d event(s) pending",
+                len(self._pending),
+            )
+            return
+        if self._direct_flush is None or self._direct_flush.done():
+            self._direct_flush = loop.create_task(self.flush())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write all pending events. Never raises -- failures are logged."""
+        while self._pending:
+            batch = self._pending[: self._batch_size]
+            del self._pending[: self._batch_size]
+            try:
+                await _write_batch(batch)
+            except Exception:
+                logger.exception("Failed to record %d LLM usage event(s)", len(batch))
+
+    async def close(self) -> None:
+        """Stop the background flusher and write whatever is still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._direct_flush is not None:
+            await self._direct_flush
+            self._direct_flush = None
+        await self.flush()
+
+
+async def _write_batch(batch: list[dict[str, Any]]) -> None:
+    from sqlalchemy import func, insert
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+    from app.core.alerts import alert_budget_threshold, alert_global_threshold
+    from app.db import async_session
+    from app.models.usage import GlobalBudget, LLMUsageEvent, UserBudget
+
+    spent_by_user: dict[str, float] = defaultdict(float)
+    for event in batch:
+        if event["user_id"]:
+            spent_by_user[event["user_id"]] += event["cost_usd"]
+    total_spent = sum(event["cost_usd"] for event in batch)
+
+    async with async_session() as session:
+        # 1. Usage events: a single executemany INSERT, no ORM unit of work
+        await session.execute(insert(LLMUsageEvent), batch)
+
+        # 2. User budget running totals: one upsert for every user in the batch
+        user_rows = []
+        if spent_by_user:
+            stmt = pg_insert(UserBudget).values(
+                [
+                    {"user_id": user_id, "total_spent_usd": spent}
+                    for user_id, spent in spent_by_user.items()
+                ]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[UserBudget.user_id],
+                set_={
+                    "total_spent_usd": UserBudget.total_spent_usd
+                    + stmt.excluded.total_spent_usd,
+                    "updated_at": func.now(),
+                },
+            ).returning(
+                UserBudget.user_id,
+                UserBudget.total_spent_usd,
+                UserBudget.monthly_budget_usd,
+            )
+            user_rows = (await session.execute(stmt)).all()
+
+        # 3. Global budget running total
+        stmt = pg_insert(GlobalBudget).values(key="global", total_spent_usd=total_spent)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[GlobalBudget.key],
+            set_={
+                "total_spent_usd": GlobalBudget.total_spent_usd
+                + stmt.excluded.total_spent_usd,
+                "updated_at": func.now(),
+            },
+        ).returning(GlobalBudget.total_spent_usd, GlobalBudget.monthly_budget_usd)
+        global_row = (await session.execute(stmt)).one()
+
+        await session.commit()
+
+    # Alert at 80% threshold
+    for user_id, spent, budget in user_rows:
+        if budget > 0 and spent / budget >= 0.8:
+            alert_budget_threshold(user_id, spent, budget, spent / budget)
+    spent, budget = global_row
+    if budget > 0 and spent / budget >= 0.8:
+        alert_global_threshold(spent, budget, spent / budget)
+
+
+usage_buffer = UsageEventBuffer()
@@ -1,13 +1,34 @@
+import re
+from typing import Any
+
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
 
+# A \u0000 escape, i.e. one preceded by an even run of backslashes (an odd run
+# means the backslash itself is escaped and the "u0000" is plain text).
+_NUL_ESCAPE_RE = re.compile(r"(?<!\\)((?:\\\\)*)\\u0000")
+
+
+def _json_dumps(obj: Any) -> str:
+    # JSON columns hold multi-MB ingestion payloads; orjson (de)serializes them
+    # far faster than the stdlib default. Non-str keys are stringified like json.
+    text = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    # JSONB rejects NUL characters, and scraped text occasionally carries them.
+    if "\\u0000" in text:
+        text = _NUL_ESCAPE_RE.sub(r"\1", text)
+    return text
+
+
 engine = create_async_engine(
     settings.effective_database_url,
     echo=False,
     pool_size=5,
     max_overflow=10,
     pool_pre_ping=True,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
 )
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
@@ -3,7 +3,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
 logger = logging.getLogger(__name__)
@@ -51,8 +51,18 @@ async def lifespan(app: FastAPI):
 
     setup_langfuse()
 
+    from app.core.usage_buffer import usage_buffer
+
+    usage_buffer.start()
+
     yield
 
+    await usage_buffer.close()
+
+    from app.plugins.http_client import close_client as close_http_client
+
+    await close_http_client()
+
 
 app = FastAPI(
     title="Minis API",
@@ -107,7 +117,7 @@ async def global_exception_handler(request, exc):
     if settings.debug:
         raise exc
     logger.exception("Unhandled exception: %s", exc)
-    return JSONResponse(status_code=500, content={"detail": "Internal server error"})
+    return ORJSONResponse(status_code=500, content={"detail": "Internal server error"})
 
 
 @app.get("/api/health")
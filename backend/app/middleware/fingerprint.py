@@ -26,7 +26,7 @@ _auth_failures: dict[str, list[float]] = defaultdict(list)
 # Thresholds for credential stuffing detection
 _STUFFING_WINDOW = 300.0  # 5 minutes
 _STUFFING_THRESHOLD = 10  # failures per window
-_AUTH_PATHS = {"/api/auth/login", "/api/auth/callback", "/api/auth/token"}
+_AUTH_PATHS = frozenset({"/api/auth/login", "/api/auth/callback", "/api/auth/token"})
 
 
 def _ip_prefix(ip: str) -> str:
@@ -62,7 +62,7 @@ class FingerprintMiddleware(BaseHTTPMiddleware):
         response = await call_next(request)
 
         # Detect credential stuffing on auth endpoints
-        if request.url.path in _AUTH_PATHS and response.status_code in (401, 403):
+        if request.scope["path"] in _AUTH_PATHS and response.status_code in (401, 403):
             now = time.monotonic()
             failures = _auth_failures[fingerprint]
             # Prune old entries
@@ -85,7 +85,8 @@ class IPRateLimitMiddleware(BaseHTTPMiddleware):
     """Sliding window rate limiter based on IP, user, or auth endpoint."""
 
     async def dispatch(self, request: Request, call_next) -> Response:
-        path = request.url.path
+        # Read the raw ASGI path; request.url builds a full URL object per request
+        path = request.scope["path"]
 
         # Skip non-API and health paths
         if path in _SKIP_PATHS or not path.startswith("/api"):
@@ -0,0 +1,105 @@
+"""Value extraction schemas: the structured personality profile pulled from evidence.
+
+Kept out of app.models.schemas so the request/response layer does not build
+validators for this model graph at import time.
+"""
+
+from __future__ import annotations
+
+from typing import Literal, NotRequired, TypedDict
+
+from pydantic import BaseModel
+
+
+class EngineeringValue(BaseModel):
+    name: str
+    description: str
+    intensity: float  # 0.0 - 1.0
+    evidence: list[str]
+
+
+class DecisionPattern(TypedDict):
+    """A recurring decision pattern: When faced with X, this person chooses Y because Z."""
+    trigger: str  # The situation or stimulus
+    response: str  # What they consistently do
+    reasoning: str  # Why they make this choice
+    evidence: list[str]  # Quotes or examples showing this pattern
+
+
+class ConflictInstance(TypedDict):
+    """A specific moment where the developer pushed back, disagreed, or defended a position."""
+    category: Literal[
+        "technical_disagreement", "style_preference", "process_pushback", "architecture_debate"
+    ]
+    summary: str  # What the conflict was about
+    their_position: str  # What they argued for
+    outcome: str  # How it resolved (conceded, compromised, held firm)
+    quote: str  # Their actual words during the conflict
+    revealed_value: str  # What this tells us about their values
+
+
+class BehavioralExample(TypedDict):
+    """A real quote from their GitHub activity with context, for few-shot prompting."""
+    context: str  # e.g. "When reviewing a PR that lacked tests"
+    quote: str  # Their actual words
+    source_type: str  # "review_comment", "issue_comment", "pr_description", "commit_message"
+
+
+class CommunicationStyle(BaseModel):
+    tone: str
+    formality: str
+    emoji_usage: str
+    catchphrases: tuple[str, ...]
+    feedback_style: str
+    # Context-dependent communication patterns
+    code_review_voice: str  # How they sound in code reviews specifically
+    issue_discussion_voice: str  # How they sound in issue discussions
+    casual_voice: str  # How they sound in informal contexts
+    signature_phrases: tuple[str, ...]  # Exact phrases they use verbatim, repeatedly
+
+
+class PersonalityPattern(BaseModel):
+    humor: str
+    directness: str
+    mentoring_style: str
+    conflict_approach: str
+
+
+class BehavioralBoundary(BaseModel):
+    """Things this developer would NEVER say or do -- equally defining as what they do."""
+    never_says: tuple[str, ...]  # Phrases, tones, or patterns they avoid
+    never_does: tuple[str, ...]  # Behaviors or approaches they reject
+    pet_peeves: tuple[str, ...]  # Things that visibly annoy or frustrate them
+    anti_values: tuple[str, ...]  # Engineering values they actively argue against
+
+
+class TechnicalOpinion(TypedDict):
+    topic: str
+    opinion: str
+    quote: NotRequired[str]
+
+
+class TechnicalProfile(BaseModel):
+    model_config = {"frozen": True}
+
+    primary_languages: tuple[str, ...] = ()
+    frameworks_and_tools: tuple[str, ...] = ()
+    domains: tuple[str, ...] = ()
+    technical_opinions: tuple[TechnicalOpinion, ...] = ()
+    projects_summary: str = ""
+
+
+# Shared default: the profile is frozen, so pydantic hands out this instance
+# as-is instead of deep-copying a fresh one for every ExtractedValues.
+_EMPTY_TECHNICAL_PROFILE = TechnicalProfile()
+
+
+class ExtractedValues(BaseModel):
+    engineering_values: list[EngineeringValue]
+    decision_patterns: list[DecisionPattern]
+    conflict_instances: list[ConflictInstance]
+    behavioral_examples: list[BehavioralExample]
+    communication_style: CommunicationStyle
+    personality_patterns: PersonalityPattern
+    behavioral_boundaries: BehavioralBoundary
+    technical_profile: TechnicalProfile = _EMPTY_TECHNICAL_PROFILE
@@ -1,23 +1,25 @@
 import datetime
 import uuid
+from typing import Any
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, UniqueConstraint, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.models.mini import Base
+from app.models.mini import Base, JSONType
 
 
 class IngestionData(Base):
     __tablename__ = "ingestion_data"
     __table_args__ = (
         UniqueConstraint("mini_id", "source_name", "data_key", name="uq_ingestion_data"),
+        Index("ix_ingestion_expires", "expires_at"),
     )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     mini_id: Mapped[str] = mapped_column(String(36), ForeignKey("minis.id", ondelete="CASCADE"))
     source_name: Mapped[str] = mapped_column(String(50))
     data_key: Mapped[str] = mapped_column(String(100))
-    data_json: Mapped[str] = mapped_column(Text)
+    data_json: Mapped[Any] = mapped_column(JSONType)
     fetched_at: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
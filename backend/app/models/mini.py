@@ -4,14 +4,20 @@ import uuid
 from sqlalchemy import (
     DateTime,
     ForeignKey,
+    Index,
     JSON,
     String,
     Text,
     UniqueConstraint,
     func,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+# Stored as JSONB on PostgreSQL so asyncpg hands back decoded Python objects;
+# falls back to the generic JSON type on other dialects.
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
 
 class Base(DeclarativeBase):
     pass
@@ -40,6 +46,7 @@ class Mini(Base):
     __tablename__ = "minis"
     __table_args__ = (
         UniqueConstraint("owner_id", "username", name="uq_mini_owner_username"),
+        Index("ix_mini_owner", "owner_id"),
     )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
@@ -58,18 +65,18 @@ class Mini(Base):
     spirit_content: Mapped[str | None] = mapped_column(Text)
     memory_content: Mapped[str | None] = mapped_column(Text)  # Factual knowledge bank
     knowledge_graph_json: Mapped[dict | None] = mapped_column(
-        JSON
+        JSONType
     )  # Structured knowledge graph (nodes/edges)
     principles_json: Mapped[dict | None] = mapped_column(
-        JSON
+        JSONType
     )  # Structured principles matrix
     system_prompt: Mapped[str | None] = mapped_column(Text)
-    values_json: Mapped[dict | None] = mapped_column(JSON)
-    roles_json: Mapped[dict | None] = mapped_column(JSON)
-    skills_json: Mapped[dict | None] = mapped_column(JSON)
-    traits_json: Mapped[dict | None] = mapped_column(JSON)
-    metadata_json: Mapped[dict | None] = mapped_column(JSON)
-    sources_used: Mapped[list | None] = mapped_column(JSON)  # JSON list of source names
+    values_json: Mapped[dict | None] = mapped_column(JSONType)
+    roles_json: Mapped[dict | None] = mapped_column(JSONType)
+    skills_json: Mapped[dict | None] = mapped_column(JSONType)
+    traits_json: Mapped[dict | None] = mapped_column(JSONType)
+    metadata_json: Mapped[dict | None] = mapped_column(JSONType)
+    sources_used: Mapped[list | None] = mapped_column(JSONType)  # JSON list of source names
     evidence_cache: Mapped[str | None] = mapped_column(
         Text
     )  # Concatenated evidence for chat tools
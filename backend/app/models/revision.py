@@ -4,7 +4,7 @@ import uuid
 from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.models.mini import Base
+from app.models.mini import Base, JSONType
 
 
 class MiniRevision(Base):
@@ -16,7 +16,7 @@ class MiniRevision(Base):
     spirit_content: Mapped[str | None] = mapped_column(Text, nullable=True)
     memory_content: Mapped[str | None] = mapped_column(Text, nullable=True)
     system_prompt: Mapped[str | None] = mapped_column(Text, nullable=True)
-    values_json: Mapped[str | None] = mapped_column(Text, nullable=True)
+    values_json: Mapped[dict | None] = mapped_column(JSONType, nullable=True)
     trigger: Mapped[str] = mapped_column(String(50), default="initial")
     created_at: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
@@ -1,33 +1,48 @@
 from __future__ import annotations
 
 import datetime
-import json
-from typing import Any, Literal
+from typing import Annotated, Any, Literal, TypedDict
 
 import re
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    ValidationError,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+    field_validator,
+    model_validator,
+)
+from pydantic_core import from_json
+
+from app.core.config import settings
+
+_GITHUB_USERNAME_RE = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$')
+
+MiniStatus = Literal["pending", "processing", "ready", "failed"]
+Visibility = Literal["public", "private", "team"]
 
 
 # -- Request schemas --
 
 class CreateMiniRequest(BaseModel):
     username: str = Field(max_length=39)
-    sources: list[str] = ["github"]  # Ingestion sources to use
-    excluded_repos: list[str] = []  # Repo full names to exclude
+    sources: tuple[str, ...] = ("github",)  # Ingestion sources to use
+    excluded_repos: tuple[str, ...] = ()  # Repo full names to exclude
     source_identifiers: dict[str, str] = {}  # Per-source identifiers (e.g. {"hackernews": "pg"})
 
     @field_validator("username")
     @classmethod
     def validate_username(cls, v: str) -> str:
-        if not re.match(r'^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$', v):
+        if not _GITHUB_USERNAME_RE.match(v):
             raise ValueError("Invalid GitHub username format")
         return v.strip()
 
 
-class ChatMessage(BaseModel):
-    role: Literal["user", "assistant"] = Field(max_length=20)
-    content: str = Field(max_length=50000)
+class ChatMessage(TypedDict):
+    role: Literal["user", "assistant"]
+    content: Annotated[str, Field(max_length=50000)]
 
 
 class ChatRequest(BaseModel):
@@ -36,7 +51,7 @@ class ChatRequest(BaseModel):
 
     @model_validator(mode="after")
     def validate_total_size(self) -> "ChatRequest":
-        total = len(self.message) + sum(len(m.content) for m in self.history)
+        total = len(self.message) + sum(len(m["content"]) for m in self.history)
         if total > 500_000:
             raise ValueError("Total message content too large")
         return self
@@ -50,181 +65,104 @@ class MiniSummary(BaseModel):
     display_name: str | None
     avatar_url: str | None
     owner_id: str | None = None
-    visibility: str = "public"
-    status: str
+    visibility: Visibility = "public"
+    status: MiniStatus
     created_at: datetime.datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True, "extra": "forbid"}
 
 
-class MiniDetailValue(BaseModel):
+class MiniDetailValue(TypedDict):
     name: str
     description: str
     intensity: float
 
 
+def _load_json_column(value: Any) -> Any:
+    """Decode a column that may hold a JSON string or an already-decoded dict/list."""
+    if isinstance(value, (str, bytes)):
+        try:
+            return from_json(value)
+        except ValueError:
+            return None
+    return value
+
+
+def _cached_json(value: Any, handler: ValidatorFunctionWrapHandler, empty: Any) -> Any:
+    # The pipeline wrote these columns itself, so skip validation unless asked for.
+    if not value:
+        return empty
+    if not settings.validate_cached_json:
+        return value
+    try:
+        return handler(value)
+    except ValidationError:
+        return empty
+
+
+def _decode_engineering_values(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    data = _load_json_column(value)
+    if not isinstance(data, dict):
+        return []
+    values = [
+        {
+            "name": v.get("name", ""),
+            "description": v.get("description", ""),
+            "intensity": v.get("intensity", 0.5),
+        }
+        for v in data.get("engineering_values", [])
+        if isinstance(v, dict)
+    ]
+    return _cached_json(values, handler, [])
+
+
+def _decode_dict(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    return _cached_json(_load_json_column(value), handler, {})
+
+
+def _decode_list(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    data = _load_json_column(value)
+    # Unvalidated values are stored as-is, so match the tuple the field serializes as
+    if isinstance(data, list):
+        data = tuple(data)
+    return _cached_json(data, handler, ())
+
+
+EngineeringValues = Annotated[list[MiniDetailValue], WrapValidator(_decode_engineering_values)]
+JSONDict = Annotated[dict, WrapValidator(_decode_dict)]
+JSONStrList = Annotated[tuple[str, ...], WrapValidator(_decode_list)]
+
+
 class MiniDetail(BaseModel):
     id: str
     username: str
     display_name: str | None
     avatar_url: str | None
     owner_id: str | None = None
-    visibility: str = "public"
+    visibility: Visibility = "public"
     org_id: str | None = None
     bio: str | None
     spirit_content: str | None
     memory_content: str | None = None
     system_prompt: str | None
-    values_json: Any = None
-    roles_json: Any = None
-    skills_json: Any = None
-    traits_json: Any = None
     metadata_json: Any = None
     sources_used: Any = None
-    values: list[MiniDetailValue] = []
-    roles: dict = {}
-    skills: list[str] = []
-    traits: list[str] = []
-    status: str
+    # Decoded straight from the raw *_json columns while the model is validated.
+    values: EngineeringValues = Field(default=[], validation_alias="values_json")
+    roles: JSONDict = Field(default={}, validation_alias="roles_json")
+    skills: JSONStrList = Field(default=(), validation_alias="skills_json")
+    traits: JSONStrList = Field(default=(), validation_alias="traits_json")
+    status: MiniStatus
     created_at: datetime.datetime
     updated_at: datetime.datetime
 
-    model_config = {"from_attributes": True}
-
-    @staticmethod
-    def _parse_json(value: Any) -> Any:
-        """Parse a value that may be a JSON string or already-decoded dict/list."""
-        if value is None:
-            return None
-        if isinstance(value, (dict, list)):
-            return value
-        try:
-            return json.loads(value)
-        except (json.JSONDecodeError, TypeError):
-            return None
-
-    @model_validator(mode="after")
-    def parse_values(self) -> MiniDetail:
-        if self.values_json:
-            try:
-                data = self._parse_json(self.values_json)
-                if data:
-                    eng_values = data.get("engineering_values", [])
-                    self.values = [
-                        MiniDetailValue(
-                            name=v.get("name", ""),
-                            description=v.get("description", ""),
-                            intensity=v.get("intensity", 0.5),
-                        )
-                        for v in eng_values
-                    ]
-            except (KeyError, TypeError):
-                # Invalid values structure, skip parsing
-                pass
-        if self.roles_json:
-            parsed = self._parse_json(self.roles_json)
-            if parsed:
-                self.roles = parsed
-        if self.skills_json:
-            parsed = self._parse_json(self.skills_json)
-            if parsed:
-                self.skills = parsed
-        if self.traits_json:
-            parsed = self._parse_json(self.traits_json)
-            if parsed:
-                self.traits = parsed
-        return self
+    model_config = {"from_attributes": True, "frozen": True, "extra": "forbid"}
 
 
 class PipelineEvent(BaseModel):
     stage: str
-    status: str  # "started", "completed", "failed"
+    status: Literal["started", "completed", "failed"]
     message: str
     progress: float  # 0.0 - 1.0
 
-
-# -- Value extraction schemas --
-
-class EngineeringValue(BaseModel):
-    name: str
-    description: str
-    intensity: float  # 0.0 - 1.0
-    evidence: list[str]
-
-
-class DecisionPattern(BaseModel):
-    """A recurring decision pattern: When faced with X, this person chooses Y because Z."""
-    trigger: str  # The situation or stimulus
-    response: str  # What they consistently do
-    reasoning: str  # Why they make this choice
-    evidence: list[str]  # Quotes or examples showing this pattern
-
-
-class ConflictInstance(BaseModel):
-    """A specific moment where the developer pushed back, disagreed, or defended a position."""
-    category: str  # "technical_disagreement", "style_preference", "process_pushback", "architecture_debate"
-    summary: str  # What the conflict was about
-    their_position: str  # What they argued for
-    outcome: str  # How it resolved (conceded, compromised, held firm)
-    quote: str  # Their actual words during the conflict
-    revealed_value: str  # What this tells us about their values
-
-
-class BehavioralExample(BaseModel):
-    """A real quote from their GitHub activity with context, for few-shot prompting."""
-    context: str  # e.g. "When reviewing a PR that lacked tests"
-    quote: str  # Their actual words
-    source_type: str  # "review_comment", "issue_comment", "pr_description", "commit_message"
-
-
-class CommunicationStyle(BaseModel):
-    tone: str
-    formality: str
-    emoji_usage: str
-    catchphrases: list[str]
-    feedback_style: str
-    # Context-dependent communication patterns
-    code_review_voice: str  # How they sound in code reviews specifically
-    issue_discussion_voice: str  # How they sound in issue discussions
-    casual_voice: str  # How they sound in informal contexts
-    signature_phrases: list[str]  # Exact phrases they use verbatim, repeatedly
-
-
-class PersonalityPattern(BaseModel):
-    humor: str
-    directness: str
-    mentoring_style: str
-    conflict_approach: str
-
-
-class BehavioralBoundary(BaseModel):
-    """Things this developer would NEVER say or do -- equally defining as what they do."""
-    never_says: list[str]  # Phrases, tones, or patterns they avoid
-    never_does: list[str]  # Behaviors or approaches they reject
-    pet_peeves: list[str]  # Things that visibly annoy or frustrate them
-    anti_values: list[str]  # Engineering values they actively argue against
-
-
-class TechnicalOpinion(BaseModel):
-    topic: str
-    opinion: str
-    quote: str = ""
-
-
-class TechnicalProfile(BaseModel):
-    primary_languages: list[str] = []
-    frameworks_and_tools: list[str] = []
-    domains: list[str] = []
-    technical_opinions: list[TechnicalOpinion] = []
-    projects_summary: str = ""
-
-
-class ExtractedValues(BaseModel):
-    engineering_values: list[EngineeringValue]
-    decision_patterns: list[DecisionPattern]
-    conflict_instances: list[ConflictInstance]
-    behavioral_examples: list[BehavioralExample]
-    communication_style: CommunicationStyle
-    personality_patterns: PersonalityPattern
-    behavioral_boundaries: BehavioralBoundary
-    technical_profile: TechnicalProfile = TechnicalProfile()
+    model_config = {"frozen": True, "extra": "forbid"}
@@ -1,7 +1,7 @@
 import datetime
 import uuid
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Text, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.mini import Base
@@ -11,12 +11,14 @@ class LLMUsageEvent(Base):
     """Individual LLM API call record for metering."""
 
     __tablename__ = "llm_usage_events"
-
-    id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    __table_args__ = (
+        # Serves both per-user lookups and per-user history ordered by time
+        Index("ix_usage_user_time", "user_id", "created_at"),
     )
+
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     user_id: Mapped[str | None] = mapped_column(
-        String(36), ForeignKey("users.id"), nullable=True, index=True
+        String(36), ForeignKey("users.id"), nullable=True
     )
     model: Mapped[str] = mapped_column(String(255))
     input_tokens: Mapped[int] = mapped_column(Integer, default=0)
@@ -35,9 +37,7 @@ class UserBudget(Base):
 
     __tablename__ = "user_budgets"
 
-    id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
-    )
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     user_id: Mapped[str] = mapped_column(
         String(36), ForeignKey("users.id"), unique=True
     )
@@ -56,9 +56,7 @@ class GlobalBudget(Base):
 
     __tablename__ = "global_budget"
 
-    id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
-    )
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     key: Mapped[str] = mapped_column(String(50), unique=True, default="global")
     monthly_budget_usd: Mapped[float] = mapped_column(Float, default=100.0)
     total_spent_usd: Mapped[float] = mapped_column(Float, default=0.0)
@@ -1,7 +1,7 @@
 import datetime
 import uuid
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.mini import Base
@@ -10,7 +10,7 @@ from app.models.mini import Base
 class UserSettings(Base):
     __tablename__ = "user_settings"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), unique=True)
     llm_api_key: Mapped[str | None] = mapped_column(Text, nullable=True)
     llm_provider: Mapped[str] = mapped_column(String(50), default="gemini")
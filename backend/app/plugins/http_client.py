@@ -0,0 +1,33 @@
+"""Shared HTTP client for ingestion sources.
+
+Sources that talk to public web APIs (Dev.to, HackerNews, Stack Overflow,
+blog feeds) share one pooled client, so repeat ingestions reuse keep-alive
+connections instead of paying DNS + TLS setup per source per run.
+"""
+
+from __future__ import annotations
+
+import httpx
+
+_CLIENT: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared ingestion HTTP client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            timeout=30,
+            follow_redirects=True,
+            headers={"User-Agent": "Minis/1.0 (ingestion)"},
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=20),
+        )
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared ingestion HTTP client. Called on application shutdown."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
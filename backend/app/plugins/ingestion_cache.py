@@ -0,0 +1,124 @@
+"""Batched access to the IngestionData cache.
+
+Ingestion sources cache fetched API payloads per mini in IngestionData, keyed
+by (source_name, data_key). These helpers read and write many keys in a single
+round-trip, so a source can load everything it needs in one query and save its
+results in one upsert.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, NamedTuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class CachedEntry(NamedTuple):
+    """One IngestionData row, as returned by ``get_cached_entries``."""
+
+    data: Any
+    fetched_at: datetime | None
+    expires_at: datetime | None
+
+
+async def get_cached_entries(
+    session: AsyncSession,
+    mini_id: str,
+    source_name: str,
+    data_keys: list[str],
+) -> dict[str, CachedEntry]:
+    """Load cached entries in one query, expired or not, keyed by data_key.
+
+    For callers that decide freshness themselves, e.g. from ``fetched_at``.
+    Missing keys are left out.
+    """
+    from app.models.ingestion_data import IngestionData
+
+    if not data_keys:
+        return {}
+
+    result = await session.execute(
+        select(
+            IngestionData.data_key,
+            IngestionData.data_json,
+            IngestionData.fetched_at,
+            IngestionData.expires_at,
+        ).where(
+            IngestionData.mini_id == mini_id,
+            IngestionData.source_name == source_name,
+            IngestionData.data_key.in_(data_keys),
+        )
+    )
+    return {data_key: CachedEntry(*rest) for data_key, *rest in result}
+
+
+async def get_cached_many(
+    session: AsyncSession,
+    mini_id: str,
+    source_name: str,
+    data_keys: list[str],
+    *,
+    allow_expired: bool = False,
+) -> dict[str, Any]:
+    """Load cached entries in one query, as a data_key -> data mapping.
+
+    Missing and expired keys are left out. With ``allow_expired``, stale entries
+    are returned too, for callers that revalidate them with the origin (e.g. via
+    ETag) rather than trusting the TTL.
+    """
+    entries = await get_cached_entries(session, mini_id, source_name, data_keys)
+    now = datetime.now(timezone.utc)
+    return {
+        data_key: entry.data
+        for data_key, entry in entries.items()
+        if allow_expired or (entry.expires_at and entry.expires_at > now)
+    }
+
+
+async def save_cache_many(
+    session: AsyncSession,
+    mini_id: str,
+    source_name: str,
+    entries: list[tuple[str, Any, int]],
+) -> None:
+    """Save or update several cached entries in one upsert.
+
+    ``entries`` are ``(data_key, data, ttl_hours)`` tuples. Repeated keys are
+    collapsed, last one wins: Postgres rejects an upsert that touches the same
+    row twice.
+    """
+    from app.models.ingestion_data import IngestionData
+
+    if not entries:
+        return
+
+    latest = {data_key: (data, ttl_hours) for data_key, data, ttl_hours in entries}
+
+    now = datetime.now(timezone.utc)
+    stmt = pg_insert(IngestionData).values(
+        [
+            {
+                "id": str(uuid.uuid4()),
+                "mini_id": mini_id,
+                "source_name": source_name,
+                "data_key": data_key,
+                "data_json": data,
+                "fetched_at": now,
+                "expires_at": now + timedelta(hours=ttl_hours),
+            }
+            for data_key, (data, ttl_hours) in latest.items()
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[IngestionData.mini_id, IngestionData.source_name, IngestionData.data_key],
+        set_={
+            "data_json": stmt.excluded.data_json,
+            "fetched_at": stmt.excluded.fetched_at,
+            "expires_at": stmt.excluded.expires_at,
+        },
+    )
+    await session.execute(stmt)
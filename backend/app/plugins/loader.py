@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
-from app.plugins.clients.web import WebClient
 from app.plugins.registry import registry
-from app.plugins.sources.blog import BlogSource
-from app.plugins.sources.claude_code import ClaudeCodeSource
-from app.plugins.sources.devblog import DevBlogSource
-from app.plugins.sources.github import GitHubSource
-from app.plugins.sources.hackernews import HackerNewsSource
-from app.plugins.sources.stackoverflow import StackOverflowSource
-from app.plugins.sources.website import WebsiteSource
 
 
 def load_plugins() -> None:
-    """Register all built-in plugins with the global registry."""
+    """Register all built-in plugins with the global registry.
+
+    Plugin modules are imported here rather than at module level so that
+    importing the app (tests, scripts, alembic) does not pull in every source's
+    dependencies until the plugins are actually registered.
+    """
+    from app.plugins.clients.web import WebClient
+    from app.plugins.sources.blog import BlogSource
+    from app.plugins.sources.claude_code import ClaudeCodeSource
+    from app.plugins.sources.devblog import DevBlogSource
+    from app.plugins.sources.github import GitHubSource
+    from app.plugins.sources.hackernews import HackerNewsSource
+    from app.plugins.sources.stackoverflow import StackOverflowSource
+    from app.plugins.sources.website import WebsiteSource
+
     # Ingestion sources
     registry.register_source(GitHubSource())
     registry.register_source(ClaudeCodeSource())
@@ -7,25 +7,67 @@ in-depth thinking that complement shorter-form GitHub activity.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
-import xml.etree.ElementTree as ET
+from collections.abc import Iterator
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from html import unescape
+from io import BytesIO
 from typing import Any
 from urllib.parse import urljoin
 
 import httpx
+from lxml import etree
+from lxml import html as lxml_html
 
 from app.plugins.base import IngestionResult, IngestionSource
+from app.plugins.http_client import get_client
 
 logger = logging.getLogger(__name__)
 
 # Common feed paths to probe when given a bare URL
 _FEED_PATHS = ("/feed", "/rss", "/atom.xml", "/feed.xml", "/rss.xml", "/index.xml")
 
+# Content-Type values that settle whether a response is a feed without sniffing
+_FEED_CONTENT_TYPES = frozenset({
+    "application/rss+xml",
+    "application/atom+xml",
+    "application/rdf+xml",
+    "application/xml",
+    "text/xml",
+})
+_HTML_CONTENT_TYPES = frozenset({"text/html", "application/xhtml+xml"})
+
 # HTML tag stripping regex
 _HTML_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# <link rel="alternate" type="application/rss+xml" href="..."> (and atom+xml)
+_FEED_LINK_RE1 = re.compile(
+    r'<link\s[^>]*rel=["\']alternate["\'][^>]*'
+    r'type=["\']application/(?:rss|atom)\+xml["\'][^>]*'
+    r'href=["\']([^"\']+)["\']',
+    re.IGNORECASE,
+)
+# Same, with the type attribute before rel
+_FEED_LINK_RE2 = re.compile(
+    r'<link\s[^>]*type=["\']application/(?:rss|atom)\+xml["\'][^>]*'
+    r'rel=["\']alternate["\'][^>]*'
+    r'href=["\']([^"\']+)["\']',
+    re.IGNORECASE,
+)
+
+# Rough sentence splitter and opinion/personality markers for excerpts
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_OPINION_RE = re.compile(
+    r"\b(I think|I believe|I prefer|I've found|in my experience|"
+    r"the problem with|what I learned|my approach|"
+    r"should|shouldn't|important|better|worse|"
+    r"love|hate|annoying|amazing|terrible|great)\b",
+    re.IGNORECASE,
+)
 
 # Namespace prefixes commonly found in Atom/RSS feeds
 _ATOM_NS = "{http://www.w3.org/2005/Atom}"
@@ -54,12 +96,7 @@ class BlogSource(IngestionSource):
         max_posts = config.get("max_posts", _MAX_POSTS)
         timeout = config.get("timeout", 15)
 
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            follow_redirects=True,
-            headers={"User-Agent": "Minis/1.0 (blog ingestion)"},
-        ) as client:
-            feed_url, feed_xml = await _resolve_feed(client, identifier)
+        feed_url, feed_xml = await _resolve_feed(get_client(), identifier, timeout=timeout)
 
         if not feed_xml:
             return IngestionResult(
@@ -112,15 +149,18 @@ class BlogSource(IngestionSource):
 
 
 async def _resolve_feed(
-    client: httpx.AsyncClient, url: str
-) -> tuple[str, str | None]:
+    client: httpx.AsyncClient, url: str, *, timeout: float = 15
+) -> tuple[str, bytes | None]:
     """Try to get RSS/Atom XML from a URL.
 
     First tries the URL directly (it might already be a feed). If that
     returns HTML, looks for <link rel="alternate"> feed references, then
     probes common feed paths.
 
-    Returns (feed_url, xml_text) or (url, None) on failure.
+    Feeds are returned as raw bytes so the XML parser can decode them
+    according to their own encoding declaration.
+
+    Returns (feed_url, xml_bytes) or (url, None) on failure.
     """
     url = url.strip()
     if not url.startswith(("http://", "https://")):
@@ -128,74 +168,74 @@ async def _resolve_feed(
 
     # Try the URL directly
     try:
-        resp = await client.get(url)
+        resp = await client.get(url, timeout=timeout)
         resp.raise_for_status()
-        body = resp.text
     except httpx.HTTPError as exc:
         logger.warning("Failed to fetch %s: %s", url, exc)
         return url, None
 
     # Check if this is already XML (feed)
-    if _looks_like_feed(body):
-        return url, body
+    if _is_feed_response(resp):
+        return url, resp.content
 
     # It's HTML — look for feed link tags
-    feed_url = _find_feed_link(body, url)
+    feed_url = _find_feed_link(resp.text, url)
     if feed_url:
         try:
-            resp = await client.get(feed_url)
+            resp = await client.get(feed_url, timeout=timeout)
             resp.raise_for_status()
-            if _looks_like_feed(resp.text):
-                return feed_url, resp.text
+            if _is_feed_response(resp):
+                return feed_url, resp.content
         except httpx.HTTPError:
             pass
 
-    # Probe common feed paths
-    for path in _FEED_PATHS:
-        probe_url = urljoin(url.rstrip("/") + "/", path.lstrip("/"))
-        try:
-            resp = await client.get(probe_url)
-            if resp.status_code == 200 and _looks_like_feed(resp.text):
-                return probe_url, resp.text
-        except httpx.HTTPError:
-            continue
+    # Probe common feed paths. All probes are in flight at once, but results
+    # are checked in _FEED_PATHS order so the preferred path still wins.
+    probe_urls = [urljoin(url.rstrip("/") + "/", path.lstrip("/")) for path in _FEED_PATHS]
+    probes = [
+        asyncio.ensure_future(client.get(probe_url, timeout=timeout)) for probe_url in probe_urls
+    ]
+    try:
+        for probe_url, probe in zip(probe_urls, probes):
+            try:
+                resp = await probe
+            except httpx.HTTPError:
+                continue
+            if resp.status_code == 200 and _is_feed_response(resp):
+                return probe_url, resp.content
+    finally:
+        for probe in probes:
+            probe.cancel()
+        await asyncio.gather(*probes, return_exceptions=True)
 
     logger.warning("No feed found for %s", url)
     return url, None
 
 
-def _looks_like_feed(text: str) -> bool:
-    """Heuristic check: does this text look like an RSS/Atom feed?"""
-    stripped = text.lstrip()[:500]
+def _is_feed_response(resp: httpx.Response) -> bool:
+    """Decide from the Content-Type header, sniffing the body only when it is unclear."""
+    content_type = resp.headers.get("content-type", "").partition(";")[0].strip().lower()
+    if content_type in _FEED_CONTENT_TYPES:
+        return True
+    if content_type in _HTML_CONTENT_TYPES:
+        return False
+    return _looks_like_feed(resp.content)
+
+
+def _looks_like_feed(body: bytes) -> bool:
+    """Heuristic check: does this response body look like an RSS/Atom feed?"""
+    stripped = body[:1024].lstrip()[:500]
     return (
-        stripped.startswith("<?xml")
-        or "<rss" in stripped
-        or "<feed" in stripped
-        or "<channel>" in stripped
+        stripped.startswith(b"<?xml")
+        or b"<rss" in stripped
+        or b"<feed" in stripped
+        or b"<channel>" in stripped
     )
 
 
 def _find_feed_link(html: str, base_url: str) -> str | None:
     """Extract RSS/Atom feed URL from HTML <link> tags."""
-    # Match <link rel="alternate" type="application/rss+xml" href="...">
-    # and <link rel="alternate" type="application/atom+xml" href="...">
-    pattern = re.compile(
-        r'<link\s[^>]*rel=["\']alternate["\'][^>]*'
-        r'type=["\']application/(?:rss|atom)\+xml["\'][^>]*'
-        r'href=["\']([^"\']+)["\']',
-        re.IGNORECASE,
-    )
-    match = pattern.search(html)
-    if not match:
-        # Try reversed attribute order (type before rel)
-        pattern2 = re.compile(
-            r'<link\s[^>]*type=["\']application/(?:rss|atom)\+xml["\'][^>]*'
-            r'rel=["\']alternate["\'][^>]*'
-            r'href=["\']([^"\']+)["\']',
-            re.IGNORECASE,
-        )
-        match = pattern2.search(html)
-
+    match = _FEED_LINK_RE1.search(html) or _FEED_LINK_RE2.search(html)
     if match:
         href = match.group(1)
         return urljoin(base_url, href)
@@ -208,115 +248,123 @@ def _find_feed_link(html: str, base_url: str) -> str | None:
 # ---------------------------------------------------------------------------
 
 
-def _parse_feed(xml_text: str, *, max_posts: int = _MAX_POSTS) -> list[dict[str, Any]]:
+def _parse_feed(xml_bytes: bytes, *, max_posts: int = _MAX_POSTS) -> list[dict[str, Any]]:
     """Parse RSS or Atom XML into a list of post dicts.
 
     Each post dict has: title, date, content, tags, word_count, link.
     Posts are sorted newest-first.
+
+    Items are parsed incrementally with lxml's iterparse, which decodes the
+    raw bytes itself, and are torn down as soon as they have been read, so
+    large feeds never sit fully in memory as a tree. Recoverable markup
+    errors (common in hand-rolled feeds) are skipped rather than fatal.
     """
+    posts: list[dict[str, Any]] = []
+    atom_entry = f"{_ATOM_NS}entry"
+
     try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError as exc:
+        for _, elem in etree.iterparse(
+            BytesIO(xml_bytes),
+            events=("end",),
+            tag=("item", atom_entry),
+            recover=True,
+            # Feeds are untrusted input: no entity expansion, no network fetches.
+            resolve_entities=False,
+            no_network=True,
+        ):
+            if elem.tag == atom_entry:
+                post = _parse_atom_entry(elem)
+            else:
+                post = _parse_rss_item(elem)
+            # Recovery can surface empty husks of broken items; skip them
+            if post["title"] or post["content"]:
+                posts.append(post)
+
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    except etree.XMLSyntaxError as exc:
         logger.warning("Failed to parse feed XML: %s", exc)
         return []
 
-    # Determine feed type and parse accordingly
-    tag = root.tag.lower().split("}")[-1] if "}" in root.tag else root.tag.lower()
-
-    if tag == "feed":
-        posts = _parse_atom(root)
-    elif tag == "rss":
-        posts = _parse_rss(root)
-    else:
-        # Try to find channel/item elements anyway
-        posts = _parse_rss(root)
-
     # Sort newest-first and cap
     posts.sort(key=lambda p: p.get("date", ""), reverse=True)
     return posts[:max_posts]
 
 
-def _parse_rss(root: ET.Element) -> list[dict[str, Any]]:
-    """Parse RSS 2.0 feed items."""
-    posts: list[dict[str, Any]] = []
-
-    for item in root.iter("item"):
-        title = _text(item, "title")
-        link = _text(item, "link")
-        pub_date = _text(item, "pubDate")
-        date = _normalize_date(pub_date)
-
-        # Content: prefer content:encoded, fall back to description
-        content = _text(item, f"{_CONTENT_NS}encoded") or _text(item, "description")
-        content = _strip_html(content)
-
-        # Tags/categories
-        tags = [cat.text.strip() for cat in item.findall("category") if cat.text]
-
-        # Author
-        author = _text(item, f"{_DC_NS}creator") or _text(item, "author")
-
-        word_count = len(content.split()) if content else 0
-
-        posts.append({
-            "title": title,
-            "date": date,
-            "content": content[:_MAX_POST_CONTENT] if content else "",
-            "tags": tags,
-            "link": link,
-            "author": author,
-            "word_count": word_count,
-        })
-
-    return posts
-
-
-def _parse_atom(root: ET.Element) -> list[dict[str, Any]]:
-    """Parse Atom feed entries."""
-    posts: list[dict[str, Any]] = []
-
-    for entry in root.iter(f"{_ATOM_NS}entry"):
-        title = _text(entry, f"{_ATOM_NS}title")
-        link_el = entry.find(f"{_ATOM_NS}link[@rel='alternate']")
-        if link_el is None:
-            link_el = entry.find(f"{_ATOM_NS}link")
-        link = link_el.get("href", "") if link_el is not None else ""
-
-        updated = _text(entry, f"{_ATOM_NS}updated") or _text(entry, f"{_ATOM_NS}published")
-        date = _normalize_date(updated)
-
-        # Content: prefer content element, fall back to summary
-        content = _text(entry, f"{_ATOM_NS}content") or _text(entry, f"{_ATOM_NS}summary")
-        content = _strip_html(content)
-
-        # Tags/categories
-        tags = [
-            cat.get("term", "").strip()
-            for cat in entry.findall(f"{_ATOM_NS}category")
-            if cat.get("term")
-        ]
-
-        author_el = entry.find(f"{_ATOM_NS}author")
-        author = ""
-        if author_el is not None:
-            author = _text(author_el, f"{_ATOM_NS}name")
+def _parse_rss_item(item: etree._Element) -> dict[str, Any]:
+    """Parse a single RSS 2.0 <item>."""
+    title = _text(item, "title")
+    link = _text(item, "link")
+    pub_date = _text(item, "pubDate")
+    date = _normalize_date(pub_date)
+
+    # Content: prefer content:encoded, fall back to description
+    content = _text(item, f"{_CONTENT_NS}encoded") or _text(item, "description")
+    content = _strip_html(content)
+
+    # Tags/categories
+    tags = [cat.text.strip() for cat in item.findall("category") if cat.text]
+
+    # Author
+    author = _text(item, f"{_DC_NS}creator") or _text(item, "author")
+
+    # _strip_html collapses whitespace to single spaces, so spaces + 1 == words
+    word_count = content.count(" ") + 1 if content else 0
+
+    return {
+        "title": title,
+        "date": date,
+        "content": content[:_MAX_POST_CONTENT] if content else "",
+        "tags": tags,
+        "link": link,
+        "author": author,
+        "word_count": word_count,
+    }
+
+
+def _parse_atom_entry(entry: etree._Element) -> dict[str, Any]:
+    """Parse a single Atom <entry>."""
+    title = _text(entry, f"{_ATOM_NS}title")
+    link_el = entry.find(f"{_ATOM_NS}link[@rel='alternate']")
+    if link_el is None:
+        link_el = entry.find(f"{_ATOM_NS}link")
+    link = link_el.get("href", "") if link_el is not None else ""
+
+    updated = _text(entry, f"{_ATOM_NS}updated") or _text(entry, f"{_ATOM_NS}published")
+    date = _normalize_date(updated)
+
+    # Content: prefer content element, fall back to summary
+    content = _text(entry, f"{_ATOM_NS}content") or _text(entry, f"{_ATOM_NS}summary")
+    content = _strip_html(content)
+
+    # Tags/categories
+    tags = [
+        cat.get("term", "").strip()
+        for cat in entry.findall(f"{_ATOM_NS}category")
+        if cat.get("term")
+    ]
 
-        word_count = len(content.split()) if content else 0
+    author_el = entry.find(f"{_ATOM_NS}author")
+    author = ""
+    if author_el is not None:
+        author = _text(author_el, f"{_ATOM_NS}name")
 
-        posts.append({
-            "title": title,
-            "date": date,
-            "content": content[:_MAX_POST_CONTENT] if content else "",
-            "tags": tags,
-            "link": link,
-            "author": author,
-            "word_count": word_count,
-        })
+    # _strip_html collapses whitespace to single spaces, so spaces + 1 == words
+    word_count = content.count(" ") + 1 if content else 0
 
-    return posts
+    return {
+        "title": title,
+        "date": date,
+        "content": content[:_MAX_POST_CONTENT] if content else "",
+        "tags": tags,
+        "link": link,
+        "author": author,
+        "word_count": word_count,
+    }
 
 
-def _text(element: ET.Element, tag: str) -> str:
+def _text(element: etree._Element, tag: str) -> str:
     """Safely extract text from a child element."""
     child = element.find(tag)
     if child is not None and child.text:
@@ -328,11 +376,14 @@ def _strip_html(text: str) -> str:
     """Remove HTML tags and decode entities."""
     if not text:
         return ""
-    cleaned = _HTML_TAG_RE.sub(" ", text)
-    cleaned = unescape(cleaned)
+    try:
+        # One C-level pass; joining text nodes with spaces keeps words at tag
+        # boundaries apart, like replacing each tag with a space does.
+        cleaned = " ".join(lxml_html.fromstring(text).itertext())
+    except (ValueError, etree.ParserError):
+        cleaned = unescape(_HTML_TAG_RE.sub(" ", text))
     # Collapse whitespace
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
-    return cleaned
+    return _WS_RE.sub(" ", cleaned).strip()
 
 
 def _normalize_date(date_str: str) -> str:
@@ -340,22 +391,14 @@ def _normalize_date(date_str: str) -> str:
     if not date_str:
         return ""
 
-    # Try ISO 8601 formats first
-    for fmt in (
-        "%Y-%m-%dT%H:%M:%S%z",
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%d",
-    ):
-        try:
-            return datetime.strptime(date_str.strip(), fmt).strftime("%Y-%m-%d")
-        except ValueError:
-            continue
+    # ISO 8601 first (Atom); fromisoformat accepts a trailing "Z" on 3.11+
+    try:
+        return datetime.fromisoformat(date_str.strip()).strftime("%Y-%m-%d")
+    except ValueError:
+        pass
 
     # RFC 2822 (common in RSS pubDate)
     try:
-        from email.utils import parsedate_to_datetime
-
         return parsedate_to_datetime(date_str).strftime("%Y-%m-%d")
     except (ValueError, TypeError):
         pass
@@ -409,19 +452,17 @@ def _extract_excerpt(content: str, max_len: int = 500) -> str:
     Prefers sentences that contain opinion/personality markers.
     Falls back to the opening of the content.
     """
-    # Split into sentences (rough)
-    sentences = re.split(r"(?<=[.!?])\s+", content)
-
-    # Look for sentences with opinion/personality signals
-    opinion_markers = re.compile(
-        r"\b(I think|I believe|I prefer|I've found|in my experience|"
-        r"the problem with|what I learned|my approach|"
-        r"should|shouldn't|important|better|worse|"
-        r"love|hate|annoying|amazing|terrible|great)\b",
-        re.IGNORECASE,
-    )
+    # Collect opinionated sentences in place, without materializing every
+    # sentence, and stop once there is enough text for the excerpt.
+    personality_sentences: list[str] = []
+    joined_len = -1
+    for start, end in _sentence_spans(content):
+        if _OPINION_RE.search(content, start, end):
+            personality_sentences.append(content[start:end])
+            joined_len += end - start + 1
+            if joined_len >= max_len:
+                break
 
-    personality_sentences = [s for s in sentences if opinion_markers.search(s)]
     if personality_sentences:
         excerpt = " ".join(personality_sentences)[:max_len]
     else:
@@ -432,3 +473,12 @@ def _extract_excerpt(content: str, max_len: int = 500) -> str:
         excerpt = excerpt.rsplit(" ", 1)[0] + "..."
 
     return excerpt
+
+
+def _sentence_spans(content: str) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) offsets of the rough sentences in content."""
+    start = 0
+    for bound in _SENT_SPLIT_RE.finditer(content):
+        yield start, bound.start()
+        start = bound.end()
+    yield start, len(content)
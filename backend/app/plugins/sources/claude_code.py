@@ -11,12 +11,24 @@ and emotional patterns.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
+import hashlib
 import logging
+import mmap
+import multiprocessing
+import os
 import re
+import sys
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+from app.core.config import settings
 from app.plugins.base import IngestionResult, IngestionSource
 
 logger = logging.getLogger(__name__)
@@ -33,11 +45,15 @@ _COMMAND_PATTERNS = re.compile(
     r"|mkdir\s+\S+"  # mkdir commands
     r"|npm\s+\w+"  # npm commands
     r"|pip\s+\w+"  # pip commands
-    r"|y|n|yes|no|ok|done|thanks|thank you|sure|right|yep|nope|yea|yeah"
     r")$",
     re.IGNORECASE,
 )
 
+# Characters a _COMMAND_PATTERNS match can start with. Bare replies ("yes",
+# "thank you", ...) are all under 10 chars and _filter_messages drops those
+# before matching, so the pattern only needs to cover paths and commands.
+_COMMAND_FIRST_CHARS = frozenset("/~cglmnpr")
+
 # Words/phrases that signal personality: opinions, emotions, decisions
 _PERSONALITY_SIGNALS = re.compile(
     r"\b("
@@ -109,12 +125,64 @@ _SECRET_RE = re.compile(
     r")"
 )
 
+# How much of each message the signal patterns scan. Long pastes would otherwise
+# cost regex time proportional to their length for no extra evidence.
+_SIGNAL_SCAN_CHARS = 2000
+
+# Literal prefixes every _SECRET_RE match starts with (or contains, for
+# ctx7sk-), used to skip the regex for the vast majority of messages
+_SECRET_PREFIXES = ("sk-", "ghp_", "ghu_", "xoxb-", "xoxp-")
+
 # Fenced code block pattern (```...```)
 _CODE_BLOCK_RE = re.compile(r"```[\s\S]*?```")
 
 # Inline code pattern (`...`)
 _INLINE_CODE_RE = re.compile(r"`[^`]+`")
 
+# Inline code and secrets, matched in a single pass by _strip_code_blocks
+# once fenced blocks are gone. Fences need their own pass first: an unpaired
+# inline backtick earlier in the text would otherwise pair with the opening
+# fence and leave the block behind.
+_STRIP_RE = re.compile(
+    rf"(?P<inline>{_INLINE_CODE_RE.pattern})"
+    rf"|(?P<secret>{_SECRET_RE.pattern})"
+)
+
+# Runs of 3+ newlines left behind after stripping code
+_MULTI_NL_RE = re.compile(r"\n{3,}")
+
+# Upper bound on threads used to parse transcript files in parallel
+_MAX_PARSE_WORKERS = 8
+
+# With parallel=True, parse in worker processes once there are at least this
+# many files; below it, process start-up costs more than it saves.
+_MIN_PROCESS_POOL_FILES = 4
+
+# Parsed transcripts are cached under a dedicated cache root (see
+# _parse_cache_root), never in the transcript directories themselves, and reused
+# while the file's path, size and mtime are unchanged. Bump the version when
+# _parse_jsonl's output changes. Small files are cheaper to re-parse than cache.
+_PARSE_CACHE_VERSION = 3
+_PARSE_CACHE_MIN_BYTES = 64 * 1024
+
+
+@dataclass(slots=True)
+class UserMessage:
+    """A human-written message parsed from a Claude Code transcript.
+
+    Slotted rather than a dict: large transcript sets hold tens of thousands
+    of these in memory at once.
+    """
+
+    raw_text: str  # The original unmodified text
+    text: str  # The natural language content (code blocks stripped)
+    timestamp: str  # ISO timestamp string
+    project_cwd: str  # The working directory from the entry
+    has_personality: bool
+    has_decision: bool
+    has_architecture: bool
+    has_tech_mention: bool
+
 
 class ClaudeCodeSource(IngestionSource):
     """Ingestion source that parses Claude Code JSONL conversation logs.
@@ -133,7 +201,10 @@ class ClaudeCodeSource(IngestionSource):
                 or the ``~/.claude/projects`` root to auto-discover all projects.
             **config: Optional overrides.
                 max_files: Maximum JSONL files to process (default 100).
-                max_messages_per_conv: Cap messages per conversation (default 40).
+                max_messages_per_conv: Stop reading a transcript once this many
+                    user messages have been taken from it (default: no cap).
+                parallel: Parse transcripts in worker processes rather than
+                    threads, using every core (default False).
         """
         data_dir = config.get("data_dir")
         if data_dir:
@@ -141,34 +212,46 @@ class ClaudeCodeSource(IngestionSource):
         else:
             path = Path(identifier).expanduser()
         max_files = config.get("max_files", 100)
-
-        projects = _discover_projects(path, max_files=max_files)
-        conversations = _discover_conversations(path, max_files=max_files)
+        max_messages_per_conv = config.get("max_messages_per_conv")
+        parallel = config.get("parallel", False)
+
+        # Listing and parsing are blocking; keep them off the event loop. Both
+        # passes below read the same files, so the tree is only walked once.
+        jsonl_files = await asyncio.to_thread(_list_jsonl_files, path, max_files=max_files)
+        projects = await asyncio.to_thread(
+            _discover_projects,
+            jsonl_files,
+            max_messages_per_conv=max_messages_per_conv,
+            parallel=parallel,
+        )
+        conversations = await asyncio.to_thread(_discover_conversations, jsonl_files)
         total_raw = sum(len(msgs) for msgs in projects.values())
 
         # Collect ALL messages grouped by project for raw_data (unfiltered)
-        messages_by_project: dict[str, list[dict[str, Any]]] = {}
-        all_messages: list[dict[str, Any]] = []
+        messages_by_project: dict[str, list[UserMessage]] = {}
+        all_messages: list[UserMessage] = []
         for proj, messages in projects.items():
             messages_by_project[proj] = messages
             all_messages.extend(messages)
 
         # Apply smart filtering for the evidence summary
-        filtered_projects: dict[str, list[dict[str, Any]]] = {}
+        filtered_projects: dict[str, dict[str, list[UserMessage]]] = {}
+        total_kept = 0
         personality_count = 0
         decision_count = 0
         architecture_count = 0
         tech_mention_count = 0
         for proj, messages in projects.items():
-            kept = _filter_messages(messages)
+            buckets = _filter_messages(messages)
+            kept = [m for bucket in buckets.values() for m in bucket]
             if kept:
-                filtered_projects[proj] = kept
-                personality_count += sum(1 for m in kept if m.get("has_personality"))
-                decision_count += sum(1 for m in kept if m.get("has_decision"))
-                architecture_count += sum(1 for m in kept if m.get("has_architecture"))
-                tech_mention_count += sum(1 for m in kept if m.get("has_tech_mention"))
+                filtered_projects[proj] = buckets
+                total_kept += len(kept)
+                personality_count += sum(1 for m in kept if m.has_personality)
+                decision_count += sum(1 for m in kept if m.has_decision)
+                architecture_count += sum(1 for m in kept if m.has_architecture)
+                tech_mention_count += sum(1 for m in kept if m.has_tech_mention)
 
-        total_kept = sum(len(msgs) for msgs in filtered_projects.values())
         evidence = _format_evidence(filtered_projects)
 
         return IngestionResult(
@@ -202,12 +285,12 @@ class ClaudeCodeSource(IngestionSource):
 # ---------------------------------------------------------------------------
 
 
-def _discover_projects(
-    path: Path, *, max_files: int = 100
-) -> dict[str, list[dict[str, Any]]]:
-    """Discover and parse JSONL files, grouped by project.
+def _list_jsonl_files(path: Path, *, max_files: int = 100) -> list[tuple[str, Path]]:
+    """List the JSONL transcripts under *path* as (project name, file) pairs.
 
-    Returns a mapping of project name -> list of message dicts.
+    *path* may be a single JSONL file, one project directory, or a root like
+    ``~/.claude/projects`` whose subdirectories are projects. At most
+    *max_files* files are returned.
     """
     jsonl_files: list[tuple[str, Path]] = []
 
@@ -217,71 +300,71 @@ def _discover_projects(
 
     elif path.is_dir():
         # Check if this is the ~/.claude/projects root (contains project dirs)
-        subdirs = [d for d in path.iterdir() if d.is_dir() and d.name != "memory"]
-        has_jsonl_directly = any(path.glob("*.jsonl"))
+        subdirs, direct_files = _scan_dir(path)
 
-        if subdirs and not has_jsonl_directly:
+        if subdirs and not direct_files:
             # This is a root like ~/.claude/projects — recurse into subdirs
-            for subdir in sorted(subdirs):
+            for subdir in subdirs:
                 project = _project_name_from_dir(subdir)
-                for f in sorted(subdir.glob("*.jsonl")):
+                for f in _scan_dir(subdir)[1]:
                     jsonl_files.append((project, f))
         else:
             # Single project directory or flat directory of JSONL files
             project = _project_name_from_dir(path)
-            for f in sorted(path.glob("*.jsonl")):
+            for f in direct_files:
                 jsonl_files.append((project, f))
     else:
         logger.warning("Claude Code path not found: %s", path)
-        return {}
 
     # Cap total files
-    jsonl_files = jsonl_files[:max_files]
+    return jsonl_files[:max_files]
 
-    projects: dict[str, list[dict[str, Any]]] = {}
-    for project, filepath in jsonl_files:
-        try:
-            messages = _parse_jsonl(filepath)
+
+def _discover_projects(
+    jsonl_files: list[tuple[str, Path]],
+    *,
+    max_messages_per_conv: int | None = None,
+    parallel: bool = False,
+) -> dict[str, list[UserMessage]]:
+    """Parse the listed JSONL files, grouped by project.
+
+    Returns a mapping of project name -> list of user messages.
+    """
+    if not jsonl_files:
+        return {}
+
+    # Parse files concurrently; map() keeps results in file order
+    pool: Executor
+    if parallel and len(jsonl_files) >= _MIN_PROCESS_POOL_FILES:
+        # JSON decoding and regex scanning hold the GIL, so only separate
+        # processes use more than one core. Spawn rather than fork: this runs
+        # inside a threaded server process.
+        pool = ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, len(jsonl_files)),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    else:
+        pool = ThreadPoolExecutor(max_workers=min(_MAX_PARSE_WORKERS, len(jsonl_files)))
+    parse = functools.partial(_parse_jsonl_safe, max_messages=max_messages_per_conv)
+    with pool:
+        parsed = pool.map(parse, (filepath for _, filepath in jsonl_files))
+
+        projects: dict[str, list[UserMessage]] = {}
+        for (project, _), messages in zip(jsonl_files, parsed):
             if messages:
                 projects.setdefault(project, []).extend(messages)
-        except Exception:
-            logger.warning("Failed to parse %s", filepath, exc_info=True)
 
     return projects
 
 
 def _discover_conversations(
-    path: Path, *, max_files: int = 100
+    jsonl_files: list[tuple[str, Path]],
 ) -> dict[str, list[dict[str, Any]]]:
-    """Discover and parse JSONL files for full conversations (user + assistant).
+    """Parse the listed JSONL files for full conversations (user + assistant).
 
     Returns a mapping of project name -> list of chronologically ordered
     conversation messages with role info.
     """
-    jsonl_files: list[tuple[str, Path]] = []
-
-    if path.is_file() and path.suffix == ".jsonl":
-        project = _project_name_from_path(path)
-        jsonl_files.append((project, path))
-
-    elif path.is_dir():
-        subdirs = [d for d in path.iterdir() if d.is_dir() and d.name != "memory"]
-        has_jsonl_directly = any(path.glob("*.jsonl"))
-
-        if subdirs and not has_jsonl_directly:
-            for subdir in sorted(subdirs):
-                project = _project_name_from_dir(subdir)
-                for f in sorted(subdir.glob("*.jsonl")):
-                    jsonl_files.append((project, f))
-        else:
-            project = _project_name_from_dir(path)
-            for f in sorted(path.glob("*.jsonl")):
-                jsonl_files.append((project, f))
-    else:
-        return {}
-
-    jsonl_files = jsonl_files[:max_files]
-
     conversations: dict[str, list[dict[str, Any]]] = {}
     for project, filepath in jsonl_files:
         try:
@@ -298,6 +381,26 @@ def _discover_conversations(
     return conversations
 
 
+def _scan_dir(dirpath: Path) -> tuple[list[Path], list[Path]]:
+    """List a directory once, returning (project subdirs, JSONL files), both sorted.
+
+    Uses ``os.scandir`` so entry types come from the directory listing itself
+    rather than a ``stat()`` per entry.
+    """
+    subdirs: list[Path] = []
+    jsonl_files: list[Path] = []
+    with os.scandir(dirpath) as it:
+        for entry in it:
+            if entry.is_dir():
+                if entry.name != "memory":
+                    subdirs.append(Path(entry.path))
+            elif entry.name.endswith(".jsonl") and entry.is_file():
+                jsonl_files.append(Path(entry.path))
+    subdirs.sort()
+    jsonl_files.sort()
+    return subdirs, jsonl_files
+
+
 def _project_name_from_path(filepath: Path) -> str:
     """Extract a project name from a JSONL file path."""
     return _project_name_from_dir(filepath.parent)
@@ -312,7 +415,16 @@ def _project_name_from_dir(dirpath: Path) -> str:
 
     We reconstruct the path and take the basename.
     """
-    name = dirpath.name
+    return _resolve_project_name(dirpath.name)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_project_name(name: str) -> str:
+    """Resolve an encoded project directory name, probing the filesystem.
+
+    Cached per name: every transcript in a project shares the same directory,
+    so the ``is_dir()`` probes only need to run once per project.
+    """
     if name.startswith("-"):
         # Try to find the actual directory on disk by reconstructing the path.
         # Naive reconstruction (all dashes -> /) is wrong for multi-segment
@@ -338,57 +450,135 @@ def _project_name_from_dir(dirpath: Path) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _parse_jsonl(filepath: Path) -> list[dict[str, Any]]:
+def _parse_jsonl(filepath: Path, max_messages: int | None = None) -> list[UserMessage]:
     """Parse a single JSONL transcript and extract user messages.
 
-    Returns a list of message dicts with keys:
-        text: The natural language content (code blocks stripped)
-        raw_text: The original unmodified text
-        timestamp: ISO timestamp string
-        project_cwd: The working directory from the entry
-        has_personality: Whether personality signals were detected
+    Transcripts are append-only, so with *max_messages* set the file is read
+    only until that many messages have been collected.
     """
-    messages: list[dict[str, Any]] = []
+    messages: list[UserMessage] = []
 
-    with open(filepath) as fh:
-        for line in fh:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                continue
+    for raw in _iter_user_lines(filepath):
+        try:
+            entry = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            continue
 
-            if entry.get("type") != "user":
-                continue
+        if entry.get("type") != "user":
+            continue
 
-            msg = entry.get("message", {})
-            if msg.get("role") != "user":
-                continue
+        msg = entry.get("message", {})
+        if msg.get("role") != "user":
+            continue
 
-            timestamp = entry.get("timestamp", "")
-            cwd = entry.get("cwd", "")
+        timestamp = entry.get("timestamp", "")
+        cwd = entry.get("cwd", "")
+        if type(cwd) is str:
+            # Every message in a transcript repeats the same cwd; share one copy.
+            cwd = sys.intern(cwd)
+
+        # Extract text content from the message
+        texts = _extract_text_content(msg.get("content", ""))
+
+        for text in texts:
+            if text:
+                stripped = _strip_code_blocks(text)
+                # Signals are classified from the opening of the message
+                # only; evidence shows at most ~500 chars of it anyway.
+                head = text[:_SIGNAL_SCAN_CHARS]
+                stripped_head = stripped[:_SIGNAL_SCAN_CHARS]
+                messages.append(
+                    UserMessage(
+                        raw_text=text,
+                        text=stripped,
+                        timestamp=timestamp,
+                        project_cwd=cwd,
+                        has_personality=bool(_PERSONALITY_SIGNALS.search(head)),
+                        has_decision=bool(_DECISION_SIGNALS.search(head)),
+                        has_architecture=bool(_ARCHITECTURE_SIGNALS.search(stripped_head)),
+                        has_tech_mention=bool(_TECH_MENTION_PATTERNS.search(stripped_head)),
+                    )
+                )
+                if max_messages is not None and len(messages) >= max_messages:
+                    return messages
 
-            # Extract text content from the message
-            texts = _extract_text_content(msg.get("content", ""))
+    return messages
 
-            for text in texts:
-                if text:
-                    stripped = _strip_code_blocks(text)
-                    messages.append(
-                        {
-                            "raw_text": text,
-                            "text": stripped,
-                            "timestamp": timestamp,
-                            "project_cwd": cwd,
-                            "has_personality": bool(_PERSONALITY_SIGNALS.search(text)),
-                            "has_decision": bool(_DECISION_SIGNALS.search(text)),
-                            "has_architecture": bool(_ARCHITECTURE_SIGNALS.search(stripped)),
-                            "has_tech_mention": bool(_TECH_MENTION_PATTERNS.search(stripped)),
-                        }
-                    )
 
+def _iter_user_lines(filepath: Path) -> Iterator[bytes]:
+    """Yield the JSONL lines of *filepath* that may hold a user entry.
+
+    Most lines are assistant/tool entries; a user entry always has the "user"
+    string somewhere (its type and role), so the file is memory-mapped and
+    searched for that marker directly. Only lines containing it are copied out
+    for parsing. Matching the bare value rather than '"type":"user"' keeps this
+    independent of JSON spacing.
+    """
+    with open(filepath, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = 0
+            while (hit := mm.find(b'"user"', pos)) != -1:
+                start = mm.rfind(b"\n", pos, hit) + 1 or pos
+                end = mm.find(b"\n", hit)
+                if end == -1:
+                    end = len(mm)
+                yield mm[start:end]
+                pos = end + 1
+
+
+def _parse_jsonl_safe(filepath: Path, max_messages: int | None = None) -> list[UserMessage]:
+    """Parse a transcript with ``_parse_jsonl``, logging and skipping unreadable files."""
+    try:
+        return _parse_jsonl_cached(filepath, max_messages)
+    except Exception:
+        logger.warning("Failed to parse %s", filepath, exc_info=True)
+        return []
+
+
+def _parse_cache_root() -> Path:
+    """Directory for parse cache files: the configured one, else the XDG cache dir."""
+    if settings.claude_code_parse_cache_dir:
+        return Path(settings.claude_code_parse_cache_dir).expanduser()
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "minis" / "claude_code"
+
+
+def _parse_jsonl_cached(filepath: Path, max_messages: int | None = None) -> list[UserMessage]:
+    """``_parse_jsonl`` backed by an on-disk cache keyed on path, size, mtime and cap.
+
+    Old conversations never change, so repeat ingestions only re-parse new or
+    modified transcripts. Cache read/write failures fall back to parsing.
+    """
+    stat = filepath.stat()
+    if stat.st_size < _PARSE_CACHE_MIN_BYTES:
+        return _parse_jsonl(filepath, max_messages)
+
+    source = str(filepath.resolve())
+    key = [_PARSE_CACHE_VERSION, source, stat.st_size, stat.st_mtime_ns, max_messages]
+    digest = hashlib.sha256(source.encode()).hexdigest()
+    cache_path = _parse_cache_root() / f"{digest}.json"
+    try:
+        cached = orjson.loads(cache_path.read_bytes())
+        if cached["key"] == key:
+            messages = [UserMessage(**m) for m in cached["messages"]]
+            for message in messages:
+                if type(message.project_cwd) is str:
+                    message.project_cwd = sys.intern(message.project_cwd)
+            return messages
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+        pass
+
+    messages = _parse_jsonl(filepath, max_messages)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(orjson.dumps({"key": key, "messages": messages}))
+        tmp_path.replace(cache_path)
+    except OSError:
+        logger.debug("Failed to write parse cache for %s", filepath, exc_info=True)
     return messages
 
 
@@ -400,14 +590,13 @@ def _parse_jsonl_conversations(filepath: Path) -> list[dict[str, Any]]:
     """
     messages: list[dict[str, Any]] = []
 
-    with open(filepath) as fh:
-        for line in fh:
-            line = line.strip()
-            if not line:
+    with open(filepath, "rb") as fh:
+        for raw in fh:
+            if raw.isspace():
                 continue
             try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
+                entry = orjson.loads(raw)
+            except orjson.JSONDecodeError:
                 continue
 
             entry_type = entry.get("type", "")
@@ -452,21 +641,20 @@ def _extract_text_content(content: str | list[Any]) -> list[str]:
     We only extract ``text`` type blocks — ``tool_result`` blocks are
     automated responses and should be skipped.
     """
-    if isinstance(content, str):
+    # orjson only produces exact str/list/dict, so ``type() is`` checks suffice.
+    if type(content) is str:
         stripped = content.strip()
         return [stripped] if stripped else []
 
-    if isinstance(content, list):
-        texts: list[str] = []
-        for block in content:
-            if not isinstance(block, dict):
-                continue
-            # Only extract text blocks — skip tool_result, images, etc.
-            if block.get("type") == "text":
-                text = block.get("text", "").strip()
-                if text:
-                    texts.append(text)
-        return texts
+    if type(content) is list:
+        # Only extract text blocks — skip tool_result, images, etc.
+        return [
+            text
+            for block in content
+            if type(block) is dict
+            and block.get("type") == "text"
+            and (text := block.get("text", "").strip())
+        ]
 
     return []
 
@@ -479,20 +667,33 @@ def _strip_code_blocks(text: str) -> str:
     ``useEffect``, ``FastAPI``).  Only fenced code blocks and long inline code
     are removed.
     """
-    # Remove fenced code blocks
-    result = _CODE_BLOCK_RE.sub("", text)
-    # Remove long inline code but keep short mentions (tech names, function names)
-    result = _INLINE_CODE_RE.sub(
-        lambda m: m.group(0) if len(m.group(0)) < 32 else "",  # 32 = 30 + 2 backticks
-        result,
-    )
-    # Redact anything that looks like a secret/API key
-    result = _SECRET_RE.sub("[REDACTED]", result)
+    if "`" in text:
+        result = _CODE_BLOCK_RE.sub("", text)
+        result = _STRIP_RE.sub(_strip_replacement, result)
+    elif any(prefix in text for prefix in _SECRET_PREFIXES):
+        # No code to strip, only secrets to redact
+        result = _SECRET_RE.sub("[REDACTED]", text)
+    else:
+        # Most messages have neither
+        result = text
     # Clean up leftover whitespace
-    result = re.sub(r"\n{3,}", "\n\n", result).strip()
+    result = _MULTI_NL_RE.sub("\n\n", result).strip()
     return result
 
 
+def _strip_replacement(match: re.Match[str]) -> str:
+    """Replacement for one ``_STRIP_RE`` match."""
+    kind = match.lastgroup
+    # Redact anything that looks like a secret/API key
+    if kind == "secret":
+        return "[REDACTED]"
+    # Keep short inline mentions (tech names, function names), still redacted
+    if kind == "inline" and len(match.group(0)) < 32:  # 32 = 30 + 2 backticks
+        return _SECRET_RE.sub("[REDACTED]", match.group(0))
+    # Long inline code is removed
+    return ""
+
+
 # ---------------------------------------------------------------------------
 # Smart Filtering
 # ---------------------------------------------------------------------------
@@ -509,18 +710,29 @@ _AUTOMATED_PREFIXES = (
     "Base directory for this skill:",
 )
 
+# How much of a message _is_automated_content looks at
+_AUTOMATED_SCAN_CHARS = 256
+
 
 def _is_automated_content(text: str) -> bool:
     """Return True if the message looks like automated/system content."""
-    if text.startswith(_AUTOMATED_PREFIXES):
+    # Only the opening of the message is needed to tell; bounding the window
+    # keeps this constant-time for very long pastes.
+    head = text[:_AUTOMATED_SCAN_CHARS]
+    if head.startswith(_AUTOMATED_PREFIXES):
         return True
     # XML-tag-heavy messages are usually system injections
-    if text.startswith("<") and text.count("<") > text.count(" ") // 3:
+    if head.startswith("<") and head.count("<") > head.count(" ") // 3:
         return True
     return False
 
 
-def _filter_messages(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+# Evidence buckets in priority order. Every kept message carries at least one
+# signal and lands in the bucket of the first one it has.
+_SIGNAL_BUCKETS = ("decision", "personality", "architecture", "tech")
+
+
+def _filter_messages(messages: list[UserMessage]) -> dict[str, list[UserMessage]]:
     """Apply smart filtering to keep messages that reveal personality.
 
     Filters out:
@@ -528,39 +740,41 @@ def _filter_messages(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
     - Messages that are just file paths or commands
     - Messages that are just automated content (tool results, hook outputs)
 
-    Prioritizes messages with personality signals and samples across time
-    to avoid recency bias.
+    Samples across time to avoid recency bias, then partitions the kept
+    messages by their highest-priority signal (see ``_SIGNAL_BUCKETS``).
+    Within a bucket, messages are ordered by the lower-priority signals they
+    also carry, then by timestamp.
     """
-    kept: list[dict[str, Any]] = []
+    kept: list[UserMessage] = []
 
     for msg in messages:
-        text = msg["text"]
+        text = msg.text
 
         # Skip very short messages
         if len(text) < 10:
             continue
 
         # Skip messages that are just commands or paths
-        if _COMMAND_PATTERNS.match(text):
+        if text[0].lower() in _COMMAND_FIRST_CHARS and _COMMAND_PATTERNS.match(text):
             continue
 
         # Skip messages that look like automated/hook content or system messages
         if _is_automated_content(text):
             continue
 
-        has_personality = msg.get("has_personality", False)
-        has_decision = msg.get("has_decision", False)
-        has_architecture = msg.get("has_architecture", False)
-        has_tech_mention = msg.get("has_tech_mention", False)
-
         # Keep if message has any high-value signal
-        if has_personality or has_decision or has_architecture or has_tech_mention:
+        if (
+            msg.has_personality
+            or msg.has_decision
+            or msg.has_architecture
+            or msg.has_tech_mention
+        ):
             kept.append(msg)
 
     # --- Anti-recency-bias: sample evenly across time ---
     # Split into time-based thirds (early, middle, recent) and take
     # proportional samples from each so no single period dominates.
-    kept.sort(key=lambda m: m.get("timestamp", ""))
+    kept.sort(key=lambda m: m.timestamp)
     if len(kept) > 60:
         third = len(kept) // 3
         early = kept[:third]
@@ -570,17 +784,19 @@ def _filter_messages(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
         per_bucket = 30
         kept = early[:per_bucket] + middle[:per_bucket] + recent[:per_bucket]
 
-    # Sort: decision/personality signals first, then architecture, then tech,
-    # then by timestamp
-    kept.sort(key=lambda m: (
-        not m.get("has_decision"),
-        not m.get("has_personality"),
-        not m.get("has_architecture"),
-        not m.get("has_tech_mention"),
-        m.get("timestamp", ""),
-    ))
+    # Partition by signal flags. kept is already in timestamp order, so each
+    # group stays chronological without another sort.
+    groups: dict[tuple[bool, bool, bool, bool], list[UserMessage]] = {}
+    for m in kept:
+        flags = (m.has_decision, m.has_personality, m.has_architecture, m.has_tech_mention)
+        groups.setdefault(flags, []).append(m)
+
+    # Decision/personality signals first, then architecture, then tech
+    buckets: dict[str, list[UserMessage]] = {name: [] for name in _SIGNAL_BUCKETS}
+    for flags in sorted(groups, reverse=True):
+        buckets[_SIGNAL_BUCKETS[flags.index(True)]].extend(groups[flags])
 
-    return kept
+    return buckets
 
 
 # ---------------------------------------------------------------------------
@@ -588,10 +804,11 @@ def _filter_messages(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
-def _format_evidence(projects: dict[str, list[dict[str, Any]]]) -> str:
+def _format_evidence(projects: dict[str, dict[str, list[UserMessage]]]) -> str:
     """Format filtered messages into evidence text for LLM personality analysis.
 
-    Groups messages by project and highlights personality-revealing content.
+    Takes the per-project buckets produced by ``_filter_messages`` and
+    highlights personality-revealing content.
     """
     if not projects:
         return ""
@@ -603,32 +820,18 @@ def _format_evidence(projects: dict[str, list[dict[str, Any]]]) -> str:
         "and personality traits.)\n"
     ]
 
-    for project, messages in sorted(projects.items()):
-        if not messages:
+    for project, buckets in sorted(projects.items()):
+        if not any(buckets.values()):
             continue
 
         sections.append(f"### Project: {project}")
 
-        # Categorize messages into distinct evidence buckets.
-        # A message can appear in at most one bucket — the highest-priority
+        # A message appears in at most one bucket — the highest-priority
         # one it matches — so we don't duplicate evidence.
-        decision_msgs: list[dict[str, Any]] = []
-        personality_msgs: list[dict[str, Any]] = []
-        architecture_msgs: list[dict[str, Any]] = []
-        tech_msgs: list[dict[str, Any]] = []
-        regular_msgs: list[dict[str, Any]] = []
-
-        for m in messages:
-            if m.get("has_decision"):
-                decision_msgs.append(m)
-            elif m.get("has_personality"):
-                personality_msgs.append(m)
-            elif m.get("has_architecture"):
-                architecture_msgs.append(m)
-            elif m.get("has_tech_mention"):
-                tech_msgs.append(m)
-            else:
-                regular_msgs.append(m)
+        decision_msgs = buckets["decision"]
+        personality_msgs = buckets["personality"]
+        architecture_msgs = buckets["architecture"]
+        tech_msgs = buckets["tech"]
 
         if decision_msgs:
             sections.append(
@@ -636,7 +839,7 @@ def _format_evidence(projects: dict[str, list[dict[str, Any]]]) -> str:
                 "(reveals how this person weighs trade-offs and makes choices):*"
             )
             for msg in decision_msgs[:40]:
-                text = _truncate(msg["text"], 500)
+                text = _truncate(msg.text, 500)
                 sections.append(f'- "{text}"')
 
         if personality_msgs:
@@ -644,7 +847,7 @@ def _format_evidence(projects: dict[str, list[dict[str, Any]]]) -> str:
                 "\n*Messages showing opinions, emotions, and personality:*"
             )
             for msg in personality_msgs[:40]:
-                text = _truncate(msg["text"], 500)
+                text = _truncate(msg.text, 500)
                 sections.append(f'- "{text}"')
 
         if architecture_msgs:
@@ -653,7 +856,7 @@ def _format_evidence(projects: dict[str, list[dict[str, Any]]]) -> str:
                 "(project structure, patterns, system design):*"
             )
             for msg in architecture_msgs[:30]:
-                text = _truncate(msg["text"], 500)
+                text = _truncate(msg.text, 500)
                 sections.append(f'- "{text}"')
 
         if tech_msgs:
@@ -662,13 +865,7 @@ def _format_evidence(projects: dict[str, list[dict[str, Any]]]) -> str:
                 "(tools, languages, frameworks mentioned):*"
             )
             for msg in tech_msgs[:30]:
-                text = _truncate(msg["text"], 400)
-                sections.append(f'- "{text}"')
-
-        if regular_msgs:
-            sections.append("\n*Other instructions and communication:*")
-            for msg in regular_msgs[:20]:
-                text = _truncate(msg["text"], 400)
+                text = _truncate(msg.text, 400)
                 sections.append(f'- "{text}"')
 
         sections.append("")
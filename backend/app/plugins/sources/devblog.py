@@ -7,18 +7,25 @@ knowledge, teaching style, and opinions on technology choices.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
 import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.plugins.base import IngestionResult, IngestionSource
+from app.plugins.http_client import get_client
+from app.plugins.ingestion_cache import get_cached_many, save_cache_many
 
 logger = logging.getLogger(__name__)
 
 _DEVTO_API = "https://dev.to/api"
 _MAX_ARTICLES = 30
 _EXCERPT_LENGTH = 1500
+# Article detail requests in flight at once. Stays under the shared client's
+# keep-alive pool (see app.plugins.http_client) so connections are reused.
+_MAX_CONCURRENT_FETCHES = 8
 
 
 class DevBlogSource(IngestionSource):
@@ -29,14 +36,27 @@ class DevBlogSource(IngestionSource):
     async def fetch(self, identifier: str, **config: Any) -> IngestionResult:
         """Fetch Dev.to articles and format as evidence.
 
+        If mini_id and session are provided in config, article bodies are cached
+        in IngestionData with their ETag and revalidated with conditional GETs,
+        so unchanged articles cost a 304 instead of a full download.
+
         Args:
             identifier: Dev.to username.
+            **config: Optional max_articles, and mini_id + session for caching.
         """
         max_articles = config.get("max_articles", _MAX_ARTICLES)
-
-        async with httpx.AsyncClient(timeout=30) as client:
-            articles = await _fetch_articles(client, identifier, max_articles)
-            detailed = await _fetch_article_bodies(client, articles)
+        mini_id: str | None = config.get("mini_id")
+        db_session: AsyncSession | None = config.get("session")
+        use_cache = mini_id is not None and db_session is not None
+
+        client = get_client()
+        articles = await _fetch_articles(client, identifier, max_articles)
+        if use_cache:
+            detailed = await _fetch_article_bodies_cached(
+                client, articles, mini_id, db_session  # type: ignore[arg-type]
+            )
+        else:
+            detailed = [a for a, _ in await _fetch_article_bodies(client, articles)]
 
         evidence = _format_evidence(identifier, detailed)
 
@@ -68,16 +88,28 @@ class DevBlogSource(IngestionSource):
 async def _fetch_articles(
     client: httpx.AsyncClient, username: str, limit: int
 ) -> list[dict[str, Any]]:
-    """Fetch article listing for a Dev.to user."""
-    articles: list[dict[str, Any]] = []
-    page = 1
+    """Fetch article listing for a Dev.to user.
+
+    Every page needed to reach ``limit`` is requested at once; pages after the
+    first empty or failed one are discarded.
+    """
+    if limit <= 0:
+        return []
     per_page = min(limit, 30)
+    pages = -(-limit // per_page)
+
+    responses = await asyncio.gather(
+        *[
+            client.get(
+                f"{_DEVTO_API}/articles",
+                params={"username": username, "per_page": per_page, "page": page},
+            )
+            for page in range(1, pages + 1)
+        ]
+    )
 
-    while len(articles) < limit:
-        resp = await client.get(
-            f"{_DEVTO_API}/articles",
-            params={"username": username, "per_page": per_page, "page": page},
-        )
+    articles: list[dict[str, Any]] = []
+    for resp in responses:
         if resp.status_code != 200:
             logger.warning("Dev.to API returned %d for user %s", resp.status_code, username)
             break
@@ -86,35 +118,105 @@ async def _fetch_articles(
         if not batch:
             break
 
-        articles.extend(batch)
-        page += 1
+        articles.extend(batch[: limit - len(articles)])
 
-    return articles[:limit]
+    return articles
 
 
 async def _fetch_article_bodies(
-    client: httpx.AsyncClient, articles: list[dict[str, Any]]
+    client: httpx.AsyncClient,
+    articles: list[dict[str, Any]],
+    cached: dict[Any, dict[str, Any]] | None = None,
+) -> list[tuple[dict[str, Any], str | None]]:
+    """Fetch full body_markdown for each article, a few requests at a time.
+
+    ``cached`` maps article id -> ``{"etag": ..., "article": ...}``; those
+    articles are requested conditionally and a 304 returns the cached copy.
+    Returns (article, etag) pairs in listing order, where etag is set only for
+    bodies freshly downloaded with one, i.e. the ones worth (re)caching.
+    """
+    cached = cached or {}
+    sem = asyncio.Semaphore(_MAX_CONCURRENT_FETCHES)
+
+    async def _fetch_one(article: dict[str, Any]) -> tuple[dict[str, Any], str | None]:
+        article_id = article["id"]
+        entry = cached.get(article_id)
+        headers = {"If-None-Match": entry["etag"]} if entry else None
+        async with sem:
+            try:
+                resp = await client.get(f"{_DEVTO_API}/articles/{article_id}", headers=headers)
+            except httpx.HTTPError:
+                logger.warning("Failed to fetch Dev.to article %s", article_id)
+                return article, None
+        if resp.status_code == 304 and entry:
+            return entry["article"], None
+        if resp.status_code == 200:
+            return _trim_article(resp.json()), resp.headers.get("etag")
+        # Fall back to listing data (no body_markdown)
+        return article, None
+
+    return list(await asyncio.gather(*[_fetch_one(a) for a in articles if a.get("id")]))
+
+
+def _trim_article(article: dict[str, Any]) -> dict[str, Any]:
+    """Drop the parts of an article detail the evidence never shows.
+
+    Keeps memory and the IngestionData cache rows small: the rendered
+    ``body_html`` goes entirely, and ``body_markdown`` is cut one character past
+    the excerpt so ``_format_evidence`` still knows to add an ellipsis.
+    """
+    article.pop("body_html", None)
+    body = article.get("body_markdown")
+    if body and len(body) > _EXCERPT_LENGTH + 1:
+        article["body_markdown"] = body[: _EXCERPT_LENGTH + 1]
+    return article
+
+
+async def _fetch_article_bodies_cached(
+    client: httpx.AsyncClient,
+    articles: list[dict[str, Any]],
+    mini_id: str,
+    session: AsyncSession,
 ) -> list[dict[str, Any]]:
-    """Fetch full body_markdown for each article."""
-    detailed: list[dict[str, Any]] = []
+    """``_fetch_article_bodies`` with ETags and bodies persisted in IngestionData."""
+    # The session is not safe for concurrent use, so cache reads and writes
+    # happen sequentially around the concurrent HTTP fan-out. Entries are
+    # revalidated with the server on every run, so expired ones are still used.
+    # The cache is best-effort: each access runs in a savepoint, and a failure
+    # only costs the conditional requests, never the ingestion.
+    ids = [article["id"] for article in articles if article.get("id")]
+    try:
+        async with session.begin_nested():
+            rows = await get_cached_many(
+                session, mini_id, "devblog", [f"article:{i}" for i in ids], allow_expired=True
+            )
+    except Exception:
+        logger.warning("Failed to read Dev.to article cache", exc_info=True)
+        rows = {}
+    cached: dict[Any, dict[str, Any]] = {}
+    for article_id in ids:
+        entry = rows.get(f"article:{article_id}")
+        if isinstance(entry, dict) and entry.get("etag") and "article" in entry:
+            cached[article_id] = entry
+
+    results = await _fetch_article_bodies(client, articles, cached)
+
+    try:
+        async with session.begin_nested():
+            await save_cache_many(
+                session,
+                mini_id,
+                "devblog",
+                [
+                    (f"article:{article['id']}", {"etag": etag, "article": article}, 24)
+                    for article, etag in results
+                    if etag
+                ],
+            )
+    except Exception:
+        logger.warning("Failed to write Dev.to article cache", exc_info=True)
 
-    for article in articles:
-        article_id = article.get("id")
-        if not article_id:
-            continue
-
-        try:
-            resp = await client.get(f"{_DEVTO_API}/articles/{article_id}")
-            if resp.status_code == 200:
-                detailed.append(resp.json())
-            else:
-                # Fall back to listing data (no body_markdown)
-                detailed.append(article)
-        except httpx.HTTPError:
-            logger.warning("Failed to fetch Dev.to article %s", article_id)
-            detailed.append(article)
-
-    return detailed
+    return [article for article, _ in results]
 
 
 def _format_evidence(username: str, articles: list[dict[str, Any]]) -> str:
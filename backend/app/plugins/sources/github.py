@@ -2,70 +2,30 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from datetime import datetime, timedelta, timezone
+from collections import Counter
 from typing import Any
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.ingestion.formatter import format_evidence
 from app.ingestion.github import GitHubData, fetch_github_data
 from app.plugins.base import IngestionResult, IngestionSource
+from app.plugins.ingestion_cache import get_cached_many, save_cache_many
 
 logger = logging.getLogger(__name__)
 
-
-async def _get_cached(session: AsyncSession, mini_id: str, source_name: str, data_key: str) -> Any | None:
-    """Check for valid cached data."""
-    from app.models.ingestion_data import IngestionData
-
-    result = await session.execute(
-        select(IngestionData).where(
-            IngestionData.mini_id == mini_id,
-            IngestionData.source_name == source_name,
-            IngestionData.data_key == data_key,
-        )
-    )
-    cached = result.scalar_one_or_none()
-    if cached and cached.expires_at and cached.expires_at > datetime.now(timezone.utc):
-        return json.loads(cached.data_json)
-    return None
-
-
-async def _save_cache(
-    session: AsyncSession, mini_id: str, source_name: str, data_key: str, data: Any, ttl_hours: int = 24
-) -> None:
-    """Save or update cached data."""
-    from app.models.ingestion_data import IngestionData
-
-    now = datetime.now(timezone.utc)
-    expires = now + timedelta(hours=ttl_hours)
-
-    result = await session.execute(
-        select(IngestionData).where(
-            IngestionData.mini_id == mini_id,
-            IngestionData.source_name == source_name,
-            IngestionData.data_key == data_key,
-        )
-    )
-    existing = result.scalar_one_or_none()
-    if existing:
-        existing.data_json = json.dumps(data)
-        existing.fetched_at = now
-        existing.expires_at = expires
-    else:
-        entry = IngestionData(
-            mini_id=mini_id,
-            source_name=source_name,
-            data_key=data_key,
-            data_json=json.dumps(data),
-            fetched_at=now,
-            expires_at=expires,
-        )
-        session.add(entry)
-    await session.flush()
+# Cache keys for one GitHub ingestion; a hit needs at least _GITHUB_REQUIRED_KEYS
+_GITHUB_CACHE_KEYS = (
+    "profile",
+    "repos",
+    "commits",
+    "pull_requests",
+    "review_comments",
+    "issue_comments",
+    "repo_languages",
+)
+_GITHUB_REQUIRED_KEYS = ("profile", "repos", "commits", "review_comments")
 
 
 class GitHubSource(IngestionSource):
@@ -137,59 +97,55 @@ class GitHubSource(IngestionSource):
         self, identifier: str, mini_id: str, session: AsyncSession
     ) -> GitHubData:
         """Fetch GitHub data, using IngestionData cache where available."""
-        # Try loading all cached pieces
-        cached_profile = await _get_cached(session, mini_id, "github", "profile")
-        cached_repos = await _get_cached(session, mini_id, "github", "repos")
-        cached_commits = await _get_cached(session, mini_id, "github", "commits")
-        cached_reviews = await _get_cached(session, mini_id, "github", "review_comments")
-
-        # If all cached, reconstruct GitHubData directly
-        if all(v is not None for v in [cached_profile, cached_repos, cached_commits, cached_reviews]):
+        # Load all cached pieces in one query
+        cached = await get_cached_many(session, mini_id, "github", list(_GITHUB_CACHE_KEYS))
+
+        # If all core pieces are cached, reconstruct GitHubData directly
+        if all(cached.get(key) is not None for key in _GITHUB_REQUIRED_KEYS):
             logger.info("Using fully cached GitHub data for %s (mini_id=%d)", identifier, mini_id)
-            cached_languages = await _get_cached(session, mini_id, "github", "repo_languages") or {}
-            cached_prs = await _get_cached(session, mini_id, "github", "pull_requests") or []
-            cached_issue_comments = await _get_cached(session, mini_id, "github", "issue_comments") or []
             return GitHubData(
-                profile=cached_profile,
-                repos=cached_repos,
-                commits=cached_commits,
-                pull_requests=cached_prs,
-                review_comments=cached_reviews,
-                issue_comments=cached_issue_comments,
-                repo_languages=cached_languages,
+                profile=cached["profile"],
+                repos=cached["repos"],
+                commits=cached["commits"],
+                pull_requests=cached.get("pull_requests") or [],
+                review_comments=cached["review_comments"],
+                issue_comments=cached.get("issue_comments") or [],
+                repo_languages=cached.get("repo_languages") or {},
             )
 
         # Cache miss — fetch fresh and save
         logger.info("Cache miss for %s (mini_id=%d), fetching from GitHub API", identifier, mini_id)
         github_data = await fetch_github_data(identifier)
 
-        # Save each piece with appropriate TTLs
-        await _save_cache(session, mini_id, "github", "profile", github_data.profile, ttl_hours=24)
-        await _save_cache(session, mini_id, "github", "repos", github_data.repos, ttl_hours=168)
-        await _save_cache(session, mini_id, "github", "commits", github_data.commits, ttl_hours=24)
-        await _save_cache(session, mini_id, "github", "pull_requests", github_data.pull_requests, ttl_hours=24)
-        await _save_cache(session, mini_id, "github", "review_comments", github_data.review_comments, ttl_hours=24)
-        await _save_cache(session, mini_id, "github", "issue_comments", github_data.issue_comments, ttl_hours=24)
-        await _save_cache(session, mini_id, "github", "repo_languages", github_data.repo_languages, ttl_hours=168)
+        # Save every piece with its TTL in a single round-trip
+        await save_cache_many(
+            session,
+            mini_id,
+            "github",
+            [
+                ("profile", github_data.profile, 24),
+                ("repos", github_data.repos, 168),
+                ("commits", github_data.commits, 24),
+                ("pull_requests", github_data.pull_requests, 24),
+                ("review_comments", github_data.review_comments, 24),
+                ("issue_comments", github_data.issue_comments, 24),
+                ("repo_languages", github_data.repo_languages, 168),
+            ],
+        )
 
         return github_data
 
 
 def _aggregate_languages(github_data: GitHubData) -> dict[str, int]:
     """Aggregate language byte counts across all repos into a sorted summary."""
-    totals: dict[str, int] = {}
+    totals: Counter[str] = Counter()
     for lang_map in github_data.repo_languages.values():
-        for lang, byte_count in lang_map.items():
-            totals[lang] = totals.get(lang, 0) + byte_count
+        totals.update(lang_map)
     # Sort by bytes descending
-    return dict(sorted(totals.items(), key=lambda x: x[1], reverse=True))
+    return dict(totals.most_common())
 
 
 def _aggregate_primary_languages(github_data: GitHubData) -> dict[str, int]:
     """Count repos by their primary language across ALL repos."""
-    counts: dict[str, int] = {}
-    for repo in github_data.repos:
-        lang = repo.get("language")
-        if lang:
-            counts[lang] = counts.get(lang, 0) + 1
-    return dict(sorted(counts.items(), key=lambda x: x[1], reverse=True))
+    counts = Counter(lang for repo in github_data.repos if (lang := repo.get("language")))
+    return dict(counts.most_common())
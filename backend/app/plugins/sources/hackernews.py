@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import re
+from datetime import datetime, timedelta, timezone
+from itertools import islice
 from typing import Any
 
 import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.plugins.base import IngestionResult, IngestionSource
+from app.plugins.http_client import get_client
+from app.plugins.ingestion_cache import get_cached_entries, save_cache_many
+
+logger = logging.getLogger(__name__)
 
 _HN_API_BASE = "https://hn.algolia.com/api/v1"
+_CACHE_TTL_HOURS = 1
 
 # Reuse the same conflict/emotion detection patterns from the GitHub formatter
 _CONFLICT_PATTERNS = re.compile(
@@ -30,6 +40,32 @@ _STRONG_EMOTION_PATTERNS = re.compile(
     r")"
 )
 
+# Scheme + authority of a story URL; group 1 is what urlparse() calls netloc
+_DOMAIN_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://([^/?#]+)")
+
+# HTML the HN API emits in comment_text, and what each becomes in evidence text
+_HTML_REPLACEMENTS = {
+    "<p>": "\n\n",
+    "</p>": "",
+    "<i>": "_",
+    "</i>": "_",
+    "<b>": "**",
+    "</b>": "**",
+    "<code>": "`",
+    "</code>": "`",
+    "<pre>": "```\n",
+    "</pre>": "\n```",
+    "&gt;": ">",
+    "&lt;": "<",
+    "&amp;": "&",
+    "&quot;": '"',
+    "&#x27;": "'",
+    "&#x2F;": "/",
+}
+_HTML_TOKEN_RE = re.compile(
+    "|".join(re.escape(token) for token in _HTML_REPLACEMENTS) + r"|<[^>]+>"
+)
+
 
 class HackerNewsSource(IngestionSource):
     """Ingestion source that fetches HackerNews activity for a username."""
@@ -39,11 +75,22 @@ class HackerNewsSource(IngestionSource):
     async def fetch(self, identifier: str, **config: Any) -> IngestionResult:
         """Fetch HackerNews comments and submissions, format as evidence.
 
+        If mini_id and session are provided in config, results are cached in
+        IngestionData for an hour and revalidated with their ETag after that.
+
         Args:
             identifier: HackerNews username.
+            **config: Optional mini_id + session for caching.
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            comments, stories = await _fetch_hn_data(client, identifier)
+        mini_id: str | None = config.get("mini_id")
+        db_session: AsyncSession | None = config.get("session")
+
+        if mini_id is not None and db_session is not None:
+            comments, stories = await _fetch_hn_data_cached(
+                get_client(), identifier, mini_id, db_session
+            )
+        else:
+            comments, stories, _ = await _fetch_hn_data(get_client(), identifier)
 
         evidence = _format_hn_evidence(identifier, comments, stories)
 
@@ -63,32 +110,109 @@ class HackerNewsSource(IngestionSource):
         )
 
 
-async def _fetch_hn_data(client: httpx.AsyncClient, username: str) -> tuple[list[dict], list[dict]]:
-    """Fetch comments and story submissions for a HN user in parallel."""
-    comments_url = f"{_HN_API_BASE}/search?tags=comment,author_{username}&hitsPerPage=100"
-    stories_url = f"{_HN_API_BASE}/search?tags=story,author_{username}&hitsPerPage=50"
-
-    comments_resp, stories_resp = await _parallel_get(client, comments_url, stories_url)
+async def _fetch_hn_data(
+    client: httpx.AsyncClient,
+    username: str,
+    cached: dict[str, dict[str, Any]] | None = None,
+) -> tuple[list[dict], list[dict], dict[str, str | None]]:
+    """Fetch comments and story submissions for a HN user in parallel.
+
+    ``cached`` maps "comments"/"stories" -> ``{"etag": ..., "hits": ...}``;
+    searches with a cached ETag are sent with If-None-Match and a 304 reuses
+    the cached hits. Returns (comments, stories, fetched), where fetched maps
+    each search that succeeded to its current ETag (or None).
+    """
+    cached = cached or {}
+    urls = {
+        "comments": f"{_HN_API_BASE}/search?tags=comment,author_{username}&hitsPerPage=100",
+        "stories": f"{_HN_API_BASE}/search?tags=story,author_{username}&hitsPerPage=50",
+    }
+
+    async def _get(key: str) -> tuple[list[dict], str | None] | None:
+        entry = cached.get(key)
+        etag = entry.get("etag") if entry else None
+        try:
+            resp = await client.get(urls[key], headers={"If-None-Match": etag} if etag else None)
+            if resp.status_code == 304 and etag:
+                return entry["hits"], etag  # type: ignore[index]
+            resp.raise_for_status()
+            return resp.json().get("hits", []), resp.headers.get("etag")
+        except (httpx.HTTPError, ValueError):
+            return None
 
-    comments = comments_resp.get("hits", []) if comments_resp else []
-    stories = stories_resp.get("hits", []) if stories_resp else []
+    async with asyncio.TaskGroup() as tg:
+        tasks = {key: tg.create_task(_get(key)) for key in urls}
 
-    return comments, stories
+    hits: dict[str, list[dict]] = {}
+    fetched: dict[str, str | None] = {}
+    for key, task in tasks.items():
+        if (result := task.result()) is None:
+            hits[key] = []
+        else:
+            hits[key], fetched[key] = result
+    return hits["comments"], hits["stories"], fetched
 
 
-async def _parallel_get(client: httpx.AsyncClient, *urls: str) -> list[dict | None]:
-    """GET multiple URLs concurrently, returning parsed JSON or None on failure."""
-    import asyncio
+async def _fetch_hn_data_cached(
+    client: httpx.AsyncClient, username: str, mini_id: str, session: AsyncSession
+) -> tuple[list[dict], list[dict]]:
+    """``_fetch_hn_data`` backed by IngestionData.
+
+    Results younger than _CACHE_TTL_HOURS are used without a request; older
+    ones are revalidated with their ETag when the API sent one, and are served
+    stale if that request fails. Keys include the username so a changed HN
+    identifier never reuses another account's activity. The cache is
+    best-effort: reads and writes run in savepoints and failures are logged.
+    """
+    keys = {"comments": f"comments:{username}", "stories": f"stories:{username}"}
+
+    # One read for fresh and stale entries alike; freshness is judged here
+    try:
+        async with session.begin_nested():
+            entries = await get_cached_entries(session, mini_id, "hackernews", list(keys.values()))
+    except Exception:
+        logger.warning("Failed to read HackerNews cache for %s", username, exc_info=True)
+        entries = {}
+    cached = {
+        key: entries[data_key].data
+        for key, data_key in keys.items()
+        if data_key in entries and _valid_entry(entries[data_key].data)
+    }
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=_CACHE_TTL_HOURS)
+    if len(cached) == len(keys) and all(
+        entries[data_key].fetched_at is not None and entries[data_key].fetched_at > cutoff
+        for data_key in keys.values()
+    ):
+        return cached["comments"]["hits"], cached["stories"]["hits"]
+
+    comments, stories, fetched = await _fetch_hn_data(client, username, cached)
+    hits = {"comments": comments, "stories": stories}
+
+    # A failed revalidation keeps serving the stale hits rather than nothing
+    for key, entry in cached.items():
+        if key not in fetched:
+            logger.warning("HackerNews %s search for %s failed; using stale cache", key, username)
+            hits[key] = entry["hits"]
+
+    # A 304 re-saves the same hits, which restarts their TTL
+    try:
+        async with session.begin_nested():
+            await save_cache_many(
+                session,
+                mini_id,
+                "hackernews",
+                [
+                    (keys[key], {"etag": etag, "hits": hits[key]}, _CACHE_TTL_HOURS)
+                    for key, etag in fetched.items()
+                ],
+            )
+    except Exception:
+        logger.warning("Failed to write HackerNews cache for %s", username, exc_info=True)
+    return hits["comments"], hits["stories"]
 
-    async def _get(url: str) -> dict | None:
-        try:
-            resp = await client.get(url)
-            resp.raise_for_status()
-            return resp.json()
-        except (httpx.HTTPError, ValueError):
-            return None
 
-    return list(await asyncio.gather(*[_get(u) for u in urls]))
+def _valid_entry(entry: Any) -> bool:
+    return isinstance(entry, dict) and isinstance(entry.get("hits"), list)
 
 
 def _format_hn_evidence(username: str, comments: list[dict], stories: list[dict]) -> str:
@@ -111,6 +235,7 @@ def _format_hn_evidence(username: str, comments: list[dict], stories: list[dict]
                         "They reveal the person's true values, communication style, and "
                         "how they engage in debate."
                     ),
+                    conflict=True,
                 )
             )
         if routine:
@@ -167,15 +292,9 @@ def _format_stories(stories: list[dict]) -> str:
         num_comments = story.get("num_comments") or 0
         url = story.get("url") or ""
 
-        domain = ""
-        if url:
-            # Extract domain for context
-            from urllib.parse import urlparse
-
-            try:
-                domain = f" ({urlparse(url).netloc})"
-            except Exception:
-                pass
+        # Extract domain for context
+        match = _DOMAIN_RE.match(url)
+        domain = f" ({match.group(1)})" if match else ""
 
         lines.append(f"- **{title}**{domain} [{points} points, {num_comments} comments]")
     return "\n".join(lines)
@@ -185,8 +304,13 @@ def _format_comments(
     comments: list[dict],
     header: str,
     preamble: str,
+    conflict: bool = False,
 ) -> str:
-    """Format a list of HN comments with signal annotations."""
+    """Format a list of HN comments with signal annotations.
+
+    ``conflict`` says whether these are the comments ``_partition_comments``
+    matched against ``_CONFLICT_PATTERNS``, so they are not scanned again.
+    """
     lines = [f"### {header}"]
     lines.append(f"({preamble})\n")
 
@@ -200,19 +324,20 @@ def _format_comments(
 
         # Detect signal markers
         tags = []
-        if _CONFLICT_PATTERNS.search(text):
+        if conflict:
             tags.append("CONFLICT/OPINION")
-        if _STRONG_EMOTION_PATTERNS.search(text):
-            emotion_matches = _STRONG_EMOTION_PATTERNS.findall(text)
-            tags.append(f"STRONG EMOTION: {', '.join(emotion_matches[:3])}")
+        # Only the first three matches are shown; stop scanning there
+        emotion_matches = [
+            m.group() for m in islice(_STRONG_EMOTION_PATTERNS.finditer(text), 3)
+        ]
+        if emotion_matches:
+            tags.append(f"STRONG EMOTION: {', '.join(emotion_matches)}")
 
         tag_str = f" [{'; '.join(tags)}]" if tags else ""
         points_str = f" [{points} points]" if points else ""
 
         # Strip HTML tags from comment text (HN API returns HTML)
-        clean_text = _strip_html(text)
-        if len(clean_text) > 600:
-            clean_text = clean_text[:600] + "..."
+        clean_text = _excerpt_html(text, 600)
 
         lines.append(f'**On: "{story_title}"**{tag_str}{points_str}')
         lines.append(f'> "{clean_text}"')
@@ -223,15 +348,34 @@ def _format_comments(
 
 def _strip_html(text: str) -> str:
     """Remove HTML tags from HN comment text."""
-    # Replace common HTML entities and tags
-    text = text.replace("<p>", "\n\n").replace("</p>", "")
-    text = text.replace("<i>", "_").replace("</i>", "_")
-    text = text.replace("<b>", "**").replace("</b>", "**")
-    text = text.replace("<code>", "`").replace("</code>", "`")
-    text = text.replace("<pre>", "```\n").replace("</pre>", "\n```")
-    text = text.replace("&gt;", ">").replace("&lt;", "<")
-    text = text.replace("&amp;", "&").replace("&quot;", '"')
-    text = text.replace("&#x27;", "'").replace("&#x2F;", "/")
-    # Strip remaining HTML tags
-    text = re.sub(r"<[^>]+>", "", text)
-    return text.strip()
+    # One pass: known tags/entities are mapped, any other tag is dropped
+    return _HTML_TOKEN_RE.sub(_html_replacement, text).strip()
+
+
+def _excerpt_html(text: str, max_len: int) -> str:
+    """``_strip_html(text)`` cut to *max_len* chars, with "..." if anything was cut.
+
+    Long comments are only stripped up to a token boundary a little past what
+    the excerpt can use, which gives the same result as stripping all of it.
+    """
+    if len(text) > 2 * max_len:
+        # Back off so the cut splits neither an entity nor a tag
+        cut = 2 * max_len
+        amp = text.rfind("&", 0, cut)
+        if amp > text.rfind(";", 0, cut):
+            cut = amp
+        lt = text.rfind("<", 0, cut)
+        if lt > text.rfind(">", 0, cut):
+            cut = lt
+        clean = _strip_html(text[:cut])
+        if len(clean) > max_len:
+            return clean[:max_len] + "..."
+
+    clean = _strip_html(text)
+    if len(clean) > max_len:
+        clean = clean[:max_len] + "..."
+    return clean
+
+
+def _html_replacement(match: re.Match[str]) -> str:
+    return _HTML_REPLACEMENTS.get(match.group(), "")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 from html import unescape
 from typing import Any
@@ -9,10 +10,13 @@ from typing import Any
 import httpx
 
 from app.plugins.base import IngestionResult, IngestionSource
+from app.plugins.http_client import get_client
 
 _API_BASE = "https://api.stackexchange.com/2.3"
 _DEFAULT_SITE = "stackoverflow"
 _PAGE_SIZE = 50
+# Stack Exchange throttles bursts from one client; keep parallel requests modest
+_MAX_CONCURRENT_REQUESTS = 5
 
 
 def _strip_html(html: str) -> str:
@@ -32,10 +36,13 @@ class StackOverflowSource(IngestionSource):
         Args:
             identifier: Stack Overflow numeric user ID or display name.
         """
-        async with httpx.AsyncClient(timeout=30) as client:
-            user_id = await self._resolve_user_id(client, identifier)
-            user_info = await self._fetch_user_info(client, user_id)
-            answers = await self._fetch_top_answers(client, user_id)
+        client = get_client()
+        user_id = await self._resolve_user_id(client, identifier)
+        # Profile and answers are independent once the user ID is known
+        user_info, answers = await asyncio.gather(
+            self._fetch_user_info(client, user_id),
+            self._fetch_top_answers(client, user_id),
+        )
 
         evidence = self._format_evidence(answers, user_info)
 
@@ -132,18 +139,29 @@ class StackOverflowSource(IngestionSource):
         if not question_ids:
             return {}
 
-        titles: dict[int, str] = {}
-        # SO API accepts semicolon-separated IDs, max ~100 per request
-        for i in range(0, len(question_ids), 100):
-            batch = question_ids[i : i + 100]
+        sem = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+
+        async def _fetch_batch(batch: list[int]) -> list[dict]:
             ids_str = ";".join(str(qid) for qid in batch)
-            resp = await client.get(
-                f"{_API_BASE}/questions/{ids_str}",
-                params={"site": _DEFAULT_SITE},
-            )
+            async with sem:
+                resp = await client.get(
+                    f"{_API_BASE}/questions/{ids_str}",
+                    params={"site": _DEFAULT_SITE},
+                )
             resp.raise_for_status()
-            data = resp.json()
-            for q in data.get("items", []):
+            return resp.json().get("items", [])
+
+        # SO API accepts semicolon-separated IDs, max ~100 per request
+        batches = await asyncio.gather(
+            *[
+                _fetch_batch(question_ids[i : i + 100])
+                for i in range(0, len(question_ids), 100)
+            ]
+        )
+
+        titles: dict[int, str] = {}
+        for items in batches:
+            for q in items:
                 titles[q["question_id"]] = unescape(q.get("title", ""))
 
         return titles
@@ -1,4 +1,3 @@
-import json
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -80,9 +79,8 @@ def _build_chat_tools(mini: Mini) -> list[AgentTool]:
         """Search the structured knowledge graph for entities and relationships."""
         if not mini.knowledge_graph_json:
             return "No knowledge graph available."
-        try:
-            kg_data = mini.knowledge_graph_json if isinstance(mini.knowledge_graph_json, dict) else json.loads(mini.knowledge_graph_json)
-        except (json.JSONDecodeError, TypeError):
+        kg_data = mini.knowledge_graph_json
+        if not isinstance(kg_data, dict):
             return "Knowledge graph data is corrupted."
 
         nodes = kg_data.get("nodes", [])
@@ -108,6 +106,11 @@ def _build_chat_tools(mini: Mini) -> list[AgentTool]:
         if not matching_nodes:
             return f"No knowledge graph entries found matching '{query}'."
 
+        # Resolve node names by ID once (first occurrence wins)
+        node_names: dict[str, str] = {}
+        for n in nodes:
+            node_names.setdefault(n["id"], n["name"])
+
         # Format results
         parts: list[str] = []
         for node in matching_nodes:
@@ -118,19 +121,10 @@ def _build_chat_tools(mini: Mini) -> list[AgentTool]:
             connected: list[str] = []
             for edge in edges:
                 if edge["source"] == node_id:
-                    target_name = edge["target"]
-                    # Try to resolve target name
-                    for n in nodes:
-                        if n["id"] == edge["target"]:
-                            target_name = n["name"]
-                            break
+                    target_name = node_names.get(edge["target"], edge["target"])
                     connected.append(f"  - {edge['relation']} -> {target_name}")
                 elif edge["target"] == node_id:
-                    source_name = edge["source"]
-                    for n in nodes:
-                        if n["id"] == edge["source"]:
-                            source_name = n["name"]
-                            break
+                    source_name = node_names.get(edge["source"], edge["source"])
                     connected.append(f"  - {source_name} {edge['relation']} -> this")
 
             parts.append(line)
@@ -258,9 +252,7 @@ async def chat_with_mini(
     system_prompt = mini.system_prompt
 
     # ── Guardrail checks (before LLM call) ───────────────────────────────
-    history_dicts: list[dict] = [
-        {"role": msg.role, "content": msg.content} for msg in body.history
-    ]
+    history_dicts: list[dict] = list(body.history)
     guardrail_result = check_message(body.message, history=history_dicts)
     if guardrail_result.injection_matches:
         log_security_event(
@@ -123,7 +123,7 @@ async def create_mini(
     return MiniSummary.model_validate(mini)
 
 
-@router.get("")
+@router.get("", response_model=list[MiniSummary])
 async def list_minis(
     mine: bool = Query(False),
     session: AsyncSession = Depends(get_session),
@@ -256,8 +256,6 @@ async def list_mini_repos(
     user: User = Depends(get_current_user),
 ):
     """List repos with their inclusion status for a mini. Owner only."""
-    import json
-
     from app.models.ingestion_data import IngestionData, MiniRepoConfig
 
     # Get the mini
@@ -277,13 +275,7 @@ async def list_mini_repos(
     )
     cached = result.scalar_one_or_none()
 
-    repos = []
-    if cached:
-        try:
-            repos = json.loads(cached.data_json)
-        except json.JSONDecodeError:
-            # Invalid JSON in cache, use empty list
-            pass
+    repos = cached.data_json if cached and isinstance(cached.data_json, list) else []
 
     # Get repo configs
     result = await session.execute(
@@ -114,7 +114,7 @@ async def get_my_usage_history(
     events = result.scalars().all()
     return [
         UsageEventResponse(
-            id=e.id,
+            id=str(e.id),
             model=e.model,
             input_tokens=e.input_tokens,
             output_tokens=e.output_tokens,
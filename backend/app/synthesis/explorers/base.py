@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from abc import ABC, abstractmethod
 
+import orjson
 from pydantic import BaseModel, Field
 
 from app.core.agent import AgentTool, run_agent
@@ -483,7 +483,7 @@ class Explorer(ABC):
         # If fallback produced JSON, try to parse it
         if not memories and not findings and result.final_response:
             try:
-                data = json.loads(result.final_response)
+                data = orjson.loads(result.final_response)
                 if isinstance(data.get("personality_findings"), str):
                     findings.append(data["personality_findings"])
                 for entry in data.get("memory_entries", []):
@@ -499,7 +499,7 @@ class Explorer(ABC):
                 for q in data.get("behavioral_quotes", []):
                     if isinstance(q, dict):
                         quotes.append(q)
-            except (json.JSONDecodeError, KeyError, TypeError):
+            except (orjson.JSONDecodeError, KeyError, TypeError):
                 # Use the raw text as a finding
                 if result.final_response:
                     findings.append(result.final_response)
@@ -10,11 +10,14 @@ else is watching.
 from __future__ import annotations
 
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from app.core.agent import AgentTool
 from app.synthesis.explorers.base import Explorer, ExplorerReport
 
+if TYPE_CHECKING:
+    from app.plugins.sources.claude_code import UserMessage
+
 
 class ClaudeCodeExplorer(Explorer):
     """Explorer specialized for Claude Code conversation evidence.
@@ -229,8 +232,8 @@ to convincingly speak in their voice and make decisions the way they do?
 
     async def explore(self, username: str, evidence: str, raw_data: dict) -> ExplorerReport:
         """Override to add message read tools for full data access."""
-        all_messages: list[dict[str, Any]] = raw_data.get("all_messages", [])
-        messages_by_project: dict[str, list[dict[str, Any]]] = raw_data.get(
+        all_messages: list[UserMessage] = raw_data.get("all_messages", [])
+        messages_by_project: dict[str, list[UserMessage]] = raw_data.get(
             "messages_by_project", {}
         )
         conversations_by_project: dict[str, list[dict[str, Any]]] = raw_data.get(
@@ -243,17 +246,17 @@ to convincingly speak in their voice and make decisions the way they do?
             project_count = len(messages_by_project)
 
             # Compute time range
-            timestamps = [m.get("timestamp", "") for m in all_messages if m.get("timestamp")]
+            timestamps = [m.timestamp for m in all_messages if m.timestamp]
             timestamps.sort()
             time_range = ""
             if timestamps:
                 time_range = f"{timestamps[0]} to {timestamps[-1]}"
 
             # Signal distribution
-            personality = sum(1 for m in all_messages if m.get("has_personality"))
-            decision = sum(1 for m in all_messages if m.get("has_decision"))
-            architecture = sum(1 for m in all_messages if m.get("has_architecture"))
-            tech_mention = sum(1 for m in all_messages if m.get("has_tech_mention"))
+            personality = sum(1 for m in all_messages if m.has_personality)
+            decision = sum(1 for m in all_messages if m.has_decision)
+            architecture = sum(1 for m in all_messages if m.has_architecture)
+            tech_mention = sum(1 for m in all_messages if m.has_tech_mention)
 
             lines = [
                 "## Claude Code Data Overview",
@@ -278,7 +281,7 @@ to convincingly speak in their voice and make decisions the way they do?
             """Return all project names with message counts and date ranges."""
             lines = ["## Projects"]
             for proj, msgs in sorted(messages_by_project.items()):
-                ts = [m.get("timestamp", "") for m in msgs if m.get("timestamp")]
+                ts = [m.timestamp for m in msgs if m.timestamp]
                 ts.sort()
                 date_range = ""
                 if ts:
@@ -299,8 +302,8 @@ to convincingly speak in their voice and make decisions the way they do?
 
             lines = [f"## {project} — messages {offset + 1}-{offset + len(page)} of {len(msgs)}"]
             for i, m in enumerate(page):
-                ts = m.get("timestamp", "")[:19]
-                raw = m.get("raw_text", m.get("text", ""))
+                ts = m.timestamp[:19]
+                raw = m.raw_text
                 # Truncate very long messages for readability
                 if len(raw) > 1000:
                     raw = raw[:1000] + "... (truncated)"
@@ -333,9 +336,9 @@ to convincingly speak in their voice and make decisions the way they do?
 
             matches: list[str] = []
             for proj, m in search_pool:
-                raw = m.get("raw_text", m.get("text", ""))
+                raw = m.raw_text
                 if pattern.search(raw):
-                    ts = m.get("timestamp", "")[:19]
+                    ts = m.timestamp[:19]
                     text = raw if len(raw) <= 500 else raw[:500] + "..."
                     matches.append(f"[{proj}] {ts}: {text}")
 
@@ -409,8 +412,8 @@ to convincingly speak in their voice and make decisions the way they do?
                 return f"Invalid message_index {message_index}. Valid range: 1-{len(user_msgs)}"
 
             target_msg = user_msgs[idx]
-            target_ts = target_msg.get("timestamp", "")
-            target_text = target_msg.get("raw_text", target_msg.get("text", ""))[:200]
+            target_ts = target_msg.timestamp
+            target_text = target_msg.raw_text[:200]
 
             # Find this message in the conversation by matching timestamp
             conv_idx = None
@@ -418,10 +421,7 @@ to convincingly speak in their voice and make decisions the way they do?
                 if cm.get("timestamp") == target_ts and cm.get("role") == "user":
                     # Also check text similarity to handle multiple user msgs at same timestamp
                     cm_text = cm.get("raw_text", cm.get("text", ""))
-                    if (
-                        cm_text[:100]
-                        == target_msg.get("raw_text", target_msg.get("text", ""))[:100]
-                    ):
+                    if cm_text[:100] == target_msg.raw_text[:100]:
                         conv_idx = ci
                         break
 
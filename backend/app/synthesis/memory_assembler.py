@@ -14,6 +14,7 @@ import litellm
 
 from app.core.config import settings
 from app.models.knowledge import (
+    KnowledgeEdge,
     KnowledgeGraph,
     KnowledgeNode,
     PrinciplesMatrix,
@@ -222,7 +223,9 @@ def _merge_principles(reports: list[ExplorerReport]) -> PrinciplesMatrix:
         # Deduplicate evidence
         unique_evidence = list(dict.fromkeys(all_evidence))
 
-        merged_p = Principle(
+        # Every field comes from already-validated Principles, so skip
+        # re-running validation on the merged copy.
+        merged_p = Principle.model_construct(
             trigger=base.trigger,
             action=base.action,
             value=base.value,
@@ -300,6 +303,14 @@ def assemble_memory(reports: list[ExplorerReport], username: str = "") -> str:
         for n in brain.nodes:
             by_type[n.type.value].append(n)
 
+        # Index the graph once instead of rescanning every edge and node per node
+        node_names: dict[str, str] = {}
+        for n in brain.nodes:
+            node_names.setdefault(n.id, n.name)
+        out_edges_by_source: dict[str, list[KnowledgeEdge]] = defaultdict(list)
+        for e in brain.edges:
+            out_edges_by_source[e.source].append(e)
+
         # Custom order or sorted keys?
         # Let's try to group roughly by importance: Languages, Frameworks, Patterns...
         type_order = [
@@ -328,16 +339,13 @@ def assemble_memory(reports: list[ExplorerReport], username: str = "") -> str:
             for n in sorted_nodes:
                 lines.append(f"- **{n.name}** (Depth: {n.depth})")
                 # Find connected edges
-                out_edges = [e for e in brain.edges if e.source == n.id]
+                out_edges = out_edges_by_source.get(n.id)
                 if out_edges:
                     # e.g. "USED_IN -> backend-repo"
                     rels = []
                     for e in out_edges:
                         # Find target name if possible, otherwise use ID
-                        target_node = next(
-                            (tn for tn in brain.nodes if tn.id == e.target), None
-                        )
-                        target_name = target_node.name if target_node else e.target
+                        target_name = node_names.get(e.target, e.target)
                         rels.append(f"{e.relation.value} -> {target_name}")
 
                     lines.append(f"  - *Rel:* {', '.join(rels)}")
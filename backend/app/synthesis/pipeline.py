@@ -10,11 +10,11 @@ Both are stored on the Mini and used together at chat time.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Sequence
 from typing import Any
 
+import orjson
 from sqlalchemy import select
 
 from app.models.mini import Mini
@@ -58,7 +58,7 @@ async def run_pipeline(
     username: str,
     session_factory: Any,
     on_progress: ProgressCallback | None = None,
-    sources: list[str] | None = None,
+    sources: Sequence[str] | None = None,
     owner_id: str | None = None,
     mini_id: str | None = None,
     source_identifiers: dict[str, str] | None = None,
@@ -362,7 +362,7 @@ async def run_pipeline(
                         spirit_content=mini.spirit_content,
                         memory_content=mini.memory_content,
                         system_prompt=mini.system_prompt,
-                        values_json=json.dumps(mini.values_json) if isinstance(mini.values_json, (dict, list)) else mini.values_json,
+                        values_json=mini.values_json,
                         trigger=trigger,
                     ))
 
@@ -372,10 +372,10 @@ async def run_pipeline(
                 mini.spirit_content = spirit_content
                 mini.memory_content = memory_content
                 mini.system_prompt = system_prompt
-                mini.values_json = json.loads(values_json) if isinstance(values_json, str) else values_json
-                mini.roles_json = json.loads(roles_json) if isinstance(roles_json, str) else roles_json
-                mini.skills_json = json.loads(skills_json) if isinstance(skills_json, str) else skills_json
-                mini.traits_json = json.loads(traits_json) if isinstance(traits_json, str) else traits_json
+                mini.values_json = orjson.loads(values_json) if isinstance(values_json, str) else values_json
+                mini.roles_json = orjson.loads(roles_json) if isinstance(roles_json, str) else roles_json
+                mini.skills_json = orjson.loads(skills_json) if isinstance(skills_json, str) else skills_json
+                mini.traits_json = orjson.loads(traits_json) if isinstance(traits_json, str) else traits_json
                 mini.knowledge_graph_json = kg_json
                 mini.principles_json = principles_json
                 mini.metadata_json = all_stats
@@ -442,7 +442,7 @@ def cleanup_event_queue(mini_id: str) -> None:
 async def run_pipeline_with_events(
     username: str,
     session_factory: Any,
-    sources: list[str] | None = None,
+    sources: Sequence[str] | None = None,
     owner_id: str | None = None,
     mini_id: str | None = None,
     source_identifiers: dict[str, str] | None = None,
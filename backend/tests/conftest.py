@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
 from app.synthesis.explorers.base import ExplorerReport, MemoryEntry
 
 
@@ -37,3 +41,23 @@ def make_report(
         memory_entries=memory_entries or [],
         behavioral_quotes=behavioral_quotes or [],
     )
+
+
+class FakeSession:
+    """AsyncSession stand-in: records executed statements and supports savepoints."""
+
+    def __init__(self) -> None:
+        self.executed: list[Any] = []
+        self.rolled_back = 0
+
+    async def execute(self, stmt: Any, params: Any = None) -> list:
+        self.executed.append(stmt)
+        return []
+
+    @asynccontextmanager
+    async def begin_nested(self) -> AsyncIterator[None]:
+        try:
+            yield
+        except BaseException:
+            self.rolled_back += 1
+            raise
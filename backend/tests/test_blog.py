@@ -0,0 +1,81 @@
+"""Tests for backend/app/plugins/sources/blog.py."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.plugins.sources.blog import _parse_feed
+
+FEEDS = Path(__file__).parent / "fixtures" / "feeds"
+
+
+def load_feed(name: str) -> bytes:
+    return (FEEDS / name).read_bytes()
+
+
+# ── _parse_feed ──────────────────────────────────────────────────────
+
+
+class TestParseRssFeed:
+    def test_items_parsed_newest_first(self):
+        posts = _parse_feed(load_feed("rss2.xml"))
+        assert [p["title"] for p in posts] == ["Why I stopped using ORMs", "Hello world"]
+
+    def test_item_fields(self):
+        post = _parse_feed(load_feed("rss2.xml"))[0]
+        assert post == {
+            "title": "Why I stopped using ORMs",
+            "date": "2026-03-03",
+            "content": "I think raw SQL is clearer. Fight me & friends.",
+            "tags": ["databases", "opinion"],
+            "link": "https://blog.example.com/orms",
+            "author": "Jane Dev",
+            "word_count": 10,
+        }
+
+    def test_description_used_without_content_encoded(self):
+        post = _parse_feed(load_feed("rss2.xml"))[1]
+        assert post["content"] == "First post on the new blog."
+        assert post["date"] == "2026-01-05"
+
+    def test_max_posts(self):
+        assert len(_parse_feed(load_feed("rss2.xml"), max_posts=1)) == 1
+
+
+class TestParseAtomFeed:
+    def test_entry_fields(self):
+        post = _parse_feed(load_feed("atom.xml"))[0]
+        assert post == {
+            "title": "Typing the untyped",
+            "date": "2026-02-10",
+            "content": "Gradual typing pays off.",
+            "tags": ["python", "types"],
+            "link": "https://atom.example.com/typing",
+            "author": "Sam Coder",
+            "word_count": 4,
+        }
+
+    def test_summary_and_published_fallbacks(self):
+        post = _parse_feed(load_feed("atom.xml"))[1]
+        assert post["content"] == "Only a summary here."
+        assert post["date"] == "2025-12-24"
+        assert post["link"] == "https://atom.example.com/older"
+
+
+class TestParseHostileFeeds:
+    def test_malformed_feed_recovers_readable_items(self):
+        posts = _parse_feed(load_feed("malformed.xml"))
+        assert posts[0]["title"] == "Survives the breakage"
+        assert posts[0]["link"] == "https://broken.example.com/ok"
+
+    def test_not_xml(self):
+        assert _parse_feed(b"<html><body>Not a feed</body></html>") == []
+
+    def test_entity_expansion_not_performed(self):
+        posts = _parse_feed(load_feed("billion_laughs.xml"))
+        assert all("lol" not in p["title"] and "lol" not in p["content"] for p in posts)
+
+    def test_external_entity_not_resolved(self):
+        posts = _parse_feed(load_feed("external_entity.xml"))
+        assert [p["title"] for p in posts] == ["Innocent title"]
+        assert "root:" not in posts[0]["content"]
@@ -0,0 +1,196 @@
+"""Tests for backend/app/plugins/sources/claude_code.py."""
+
+from __future__ import annotations
+
+import mmap
+import os
+import sys
+
+import orjson
+import pytest
+
+from app.core.config import settings
+from app.plugins.sources import claude_code
+from app.plugins.sources.claude_code import (
+    _iter_user_lines,
+    _parse_jsonl_cached,
+    _strip_code_blocks,
+)
+
+
+def user_line(text: str, cwd: str = "/home/dev/project") -> bytes:
+    """One JSONL transcript line holding a user message."""
+    entry = {
+        "type": "user",
+        "cwd": cwd,
+        "timestamp": "2026-01-01T00:00:00Z",
+        "message": {"role": "user", "content": text},
+    }
+    return orjson.dumps(entry) + b"\n"
+
+
+def assistant_line(text: str) -> bytes:
+    """One JSONL transcript line holding an assistant message."""
+    entry = {"type": "assistant", "message": {"role": "assistant", "content": text}}
+    return orjson.dumps(entry) + b"\n"
+
+
+# ── _strip_code_blocks ───────────────────────────────────────────────
+
+
+class TestStripCodeBlocks:
+    def test_removes_fenced_block(self):
+        text = "Try this:\n```python\nprint('hi')\n```\nthen run it"
+        assert _strip_code_blocks(text) == "Try this:\n\nthen run it"
+
+    def test_keeps_short_inline_code(self):
+        assert _strip_code_blocks("Use `useEffect` here") == "Use `useEffect` here"
+
+    def test_removes_long_inline_code(self):
+        text = "Run `some --very --long --command --with --flags` now"
+        assert _strip_code_blocks(text) == "Run  now"
+
+    def test_unpaired_backtick_before_fence(self):
+        text = "Don't use the `old helper, run:\n```\nexport KEY=abc\nfoo()\n```\nthen retry"
+        assert _strip_code_blocks(text) == "Don't use the `old helper, run:\n\nthen retry"
+
+    def test_redacts_secrets(self):
+        text = "my key is sk-" + "a" * 24 + " ok"
+        assert _strip_code_blocks(text) == "my key is [REDACTED] ok"
+
+    def test_redacts_secret_inside_short_inline_code(self):
+        text = "set `ghp_" + "b" * 20 + "` first"
+        assert _strip_code_blocks(text) == "set `[REDACTED]` first"
+
+    def test_plain_text_unchanged(self):
+        assert _strip_code_blocks("  just words\n\n\n\nmore  ") == "just words\n\nmore"
+
+
+# ── _iter_user_lines ─────────────────────────────────────────────────
+
+
+class TestIterUserLines:
+    def test_empty_file(self, tmp_path):
+        transcript = tmp_path / "session.jsonl"
+        transcript.write_bytes(b"")
+        assert list(_iter_user_lines(transcript)) == []
+
+    def test_no_user_lines(self, tmp_path):
+        transcript = tmp_path / "session.jsonl"
+        transcript.write_bytes(assistant_line("hello") + assistant_line("world"))
+        assert list(_iter_user_lines(transcript)) == []
+
+    def test_final_line_without_newline(self, tmp_path):
+        transcript = tmp_path / "session.jsonl"
+        last = user_line("last message").rstrip(b"\n")
+        transcript.write_bytes(assistant_line("hello") + last)
+        assert list(_iter_user_lines(transcript)) == [last]
+
+    def test_line_with_several_markers_yielded_once(self, tmp_path):
+        transcript = tmp_path / "session.jsonl"
+        line = user_line('quoting "user" in the text')
+        transcript.write_bytes(assistant_line("hello") + line + assistant_line("bye"))
+        assert list(_iter_user_lines(transcript)) == [line.rstrip(b"\n")]
+
+    def test_line_split_across_page_boundary(self, tmp_path):
+        # The user line starts just before a page boundary and its "user"
+        # marker sits after it; the whole line must still come back intact.
+        transcript = tmp_path / "session.jsonl"
+        filler = assistant_line("x" * (mmap.PAGESIZE - 4 - len(assistant_line(""))))
+        line = user_line("y" * 500)
+        assert len(filler) < mmap.PAGESIZE < len(filler) + line.index(b'"user"')
+        transcript.write_bytes(filler + line + filler)
+        assert list(_iter_user_lines(transcript)) == [line.rstrip(b"\n")]
+
+    def test_matches_line_by_line_filter(self, tmp_path):
+        transcript = tmp_path / "session.jsonl"
+        lines = [
+            user_line("first"),
+            assistant_line("reply"),
+            b"\n",
+            assistant_line('mentions "user" too'),
+            user_line("second"),
+            user_line("third"),
+        ]
+        data = b"".join(lines)
+        transcript.write_bytes(data)
+        expected = [line for line in data.split(b"\n") if b'"user"' in line]
+        assert list(_iter_user_lines(transcript)) == expected
+
+
+# ── _parse_jsonl_cached ──────────────────────────────────────────────
+
+
+@pytest.fixture
+def parse_cache(tmp_path, monkeypatch):
+    """Point the parse cache at a temp dir and cache files of any size."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(settings, "claude_code_parse_cache_dir", str(cache_dir))
+    monkeypatch.setattr(claude_code, "_PARSE_CACHE_MIN_BYTES", 0)
+    return cache_dir
+
+
+class TestParseJsonlCached:
+    def test_cache_written_outside_transcript_dir(self, tmp_path, parse_cache):
+        transcript = tmp_path / "project" / "session.jsonl"
+        transcript.parent.mkdir()
+        transcript.write_bytes(user_line("first message"))
+
+        _parse_jsonl_cached(transcript)
+
+        assert len(list(parse_cache.glob("*.json"))) == 1
+        assert [p.name for p in transcript.parent.iterdir()] == ["session.jsonl"]
+
+    def test_unchanged_file_served_from_cache(self, tmp_path, parse_cache, monkeypatch):
+        transcript = tmp_path / "session.jsonl"
+        transcript.write_bytes(user_line("first message"))
+        first = _parse_jsonl_cached(transcript)
+
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("expected a cache hit")
+
+        monkeypatch.setattr(claude_code, "_parse_jsonl", fail_parse)
+        assert _parse_jsonl_cached(transcript) == first
+
+    def test_changed_file_invalidates_cache(self, tmp_path, parse_cache):
+        transcript = tmp_path / "session.jsonl"
+        transcript.write_bytes(user_line("first message"))
+        assert [m.text for m in _parse_jsonl_cached(transcript)] == ["first message"]
+
+        with open(transcript, "ab") as fh:
+            fh.write(user_line("second message"))
+
+        assert [m.text for m in _parse_jsonl_cached(transcript)] == [
+            "first message",
+            "second message",
+        ]
+
+    def test_same_size_rewrite_invalidates_cache(self, tmp_path, parse_cache):
+        transcript = tmp_path / "session.jsonl"
+        transcript.write_bytes(user_line("first message"))
+        _parse_jsonl_cached(transcript)
+
+        transcript.write_bytes(user_line("other message"))
+        stat = transcript.stat()
+        os.utime(transcript, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert [m.text for m in _parse_jsonl_cached(transcript)] == ["other message"]
+
+    def test_cache_keyed_per_path(self, tmp_path, parse_cache):
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "session.jsonl").write_bytes(user_line(f"from {name}"))
+
+        assert _parse_jsonl_cached(tmp_path / "a" / "session.jsonl")[0].text == "from a"
+        assert _parse_jsonl_cached(tmp_path / "b" / "session.jsonl")[0].text == "from b"
+
+    def test_cached_cwd_is_interned(self, tmp_path, parse_cache):
+        transcript = tmp_path / "session.jsonl"
+        cwd = "/home/dev/" + "interned-project"
+        transcript.write_bytes(user_line("first message", cwd) + user_line("second message", cwd))
+        _parse_jsonl_cached(transcript)
+
+        messages = _parse_jsonl_cached(transcript)
+
+        assert messages[0].project_cwd is messages[1].project_cwd
+        assert messages[0].project_cwd is sys.intern(cwd)
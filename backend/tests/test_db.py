@@ -0,0 +1,24 @@
+"""Tests for backend/app/db.py."""
+
+from __future__ import annotations
+
+import orjson
+
+from app.db import _json_dumps
+
+# ── _json_dumps ──────────────────────────────────────────────────────
+
+
+class TestJsonDumps:
+    def test_strips_nul_characters(self):
+        assert orjson.loads(_json_dumps({"a": "x\x00y", "\x00k": ["\x00\x00"]})) == {
+            "a": "xy",
+            "k": [""],
+        }
+
+    def test_keeps_escaped_backslash_before_u0000(self):
+        obj = {"a": "\\u0000", "b": "\\\x00"}
+        assert orjson.loads(_json_dumps(obj)) == {"a": "\\u0000", "b": "\\"}
+
+    def test_non_str_keys(self):
+        assert _json_dumps({1: "one"}) == '{"1":"one"}'
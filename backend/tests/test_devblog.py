@@ -0,0 +1,133 @@
+"""Tests for backend/app/plugins/sources/devblog.py."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from app.plugins.sources import devblog
+from app.plugins.sources.devblog import (
+    _EXCERPT_LENGTH,
+    _fetch_article_bodies_cached,
+    _trim_article,
+)
+from tests.conftest import FakeSession
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Replace the IngestionData helpers with an in-memory store."""
+    store: dict[str, dict] = {}
+    saved: list[tuple[str, dict, int]] = []
+
+    async def fake_get_cached_many(session, mini_id, source_name, data_keys, **kwargs):
+        return {key: store[key] for key in data_keys if key in store}
+
+    async def fake_save_cache_many(session, mini_id, source_name, entries):
+        saved.extend(entries)
+
+    monkeypatch.setattr(devblog, "get_cached_many", fake_get_cached_many)
+    monkeypatch.setattr(devblog, "save_cache_many", fake_save_cache_many)
+    return store, saved
+
+
+def _client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+# ── _fetch_article_bodies_cached ─────────────────────────────────────
+
+
+class TestFetchArticleBodiesCached:
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_cached_article(self, cache):
+        store, saved = cache
+        cached_article = {"id": 1, "title": "Cached", "body_markdown": "old body"}
+        store["article:1"] = {"etag": '"v1"', "article": cached_article}
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(304)
+
+        async with _client(handler) as client:
+            result = await _fetch_article_bodies_cached(
+                client, [{"id": 1, "title": "Listing"}], "mini-1", FakeSession()
+            )
+
+        assert result == [cached_article]
+        assert requests[0].headers["If-None-Match"] == '"v1"'
+        assert saved == []
+
+    @pytest.mark.asyncio
+    async def test_downloaded_article_is_cached_with_etag(self, cache):
+        _, saved = cache
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert "If-None-Match" not in request.headers
+            return httpx.Response(
+                200,
+                json={"id": 2, "title": "Fresh", "body_markdown": "new", "body_html": "<p>new</p>"},
+                headers={"ETag": '"v2"'},
+            )
+
+        async with _client(handler) as client:
+            result = await _fetch_article_bodies_cached(
+                client, [{"id": 2, "title": "Listing"}], "mini-1", FakeSession()
+            )
+
+        article = {"id": 2, "title": "Fresh", "body_markdown": "new"}
+        assert result == [article]
+        assert saved == [("article:2", {"etag": '"v2"', "article": article}, 24)]
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_falls_back_to_listing(self, cache):
+        _, saved = cache
+        listing = {"id": 3, "title": "Listing"}
+
+        async with _client(lambda request: httpx.Response(500)) as client:
+            result = await _fetch_article_bodies_cached(client, [listing], "mini-1", FakeSession())
+
+        assert result == [listing]
+        assert saved == []
+
+    @pytest.mark.asyncio
+    async def test_cache_failures_do_not_abort_fetch(self, monkeypatch):
+        async def failing_cache(*args, **kwargs):
+            raise RuntimeError("db down")
+
+        monkeypatch.setattr(devblog, "get_cached_many", failing_cache)
+        monkeypatch.setattr(devblog, "save_cache_many", failing_cache)
+        session = FakeSession()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"id": 4, "title": "Fresh"}, headers={"ETag": '"v4"'})
+
+        async with _client(handler) as client:
+            result = await _fetch_article_bodies_cached(
+                client, [{"id": 4, "title": "Listing"}], "mini-1", session
+            )
+
+        assert result == [{"id": 4, "title": "Fresh"}]
+        assert session.rolled_back == 2
+
+
+# ── _trim_article ────────────────────────────────────────────────────
+
+
+class TestTrimArticle:
+    def test_drops_body_html(self):
+        article = _trim_article({"title": "T", "body_html": "<p>x</p>", "body_markdown": "x"})
+        assert article == {"title": "T", "body_markdown": "x"}
+
+    def test_cuts_long_body_one_past_excerpt(self):
+        body = "a" * (_EXCERPT_LENGTH * 2)
+        article = _trim_article({"body_markdown": body})
+        assert article["body_markdown"] == body[: _EXCERPT_LENGTH + 1]
+
+    def test_keeps_short_body(self):
+        body = "a" * (_EXCERPT_LENGTH + 1)
+        assert _trim_article({"body_markdown": body})["body_markdown"] == body
+
+    def test_missing_body(self):
+        assert _trim_article({"title": "T"}) == {"title": "T"}
@@ -0,0 +1,166 @@
+"""Tests for backend/app/plugins/sources/hackernews.py."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from app.plugins.ingestion_cache import CachedEntry
+from app.plugins.sources import hackernews
+from app.plugins.sources.hackernews import _fetch_hn_data_cached
+from tests.conftest import FakeSession
+
+COMMENT = {"objectID": "1", "comment_text": "cached comment"}
+STORY = {"objectID": "2", "title": "cached story"}
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Replace the IngestionData helpers with an in-memory store."""
+    store: dict[str, CachedEntry] = {}
+    saved: list[tuple[str, dict, int]] = []
+
+    async def fake_get_cached_entries(session, mini_id, source_name, data_keys):
+        return {key: store[key] for key in data_keys if key in store}
+
+    async def fake_save_cache_many(session, mini_id, source_name, entries):
+        saved.extend(entries)
+
+    monkeypatch.setattr(hackernews, "get_cached_entries", fake_get_cached_entries)
+    monkeypatch.setattr(hackernews, "save_cache_many", fake_save_cache_many)
+    return store, saved
+
+
+def _store_hits(store: dict[str, CachedEntry], age: timedelta) -> None:
+    fetched_at = datetime.now(timezone.utc) - age
+    for key, etag, hits in (("comments", '"c1"', [COMMENT]), ("stories", '"s1"', [STORY])):
+        store[f"{key}:pg"] = CachedEntry(
+            data={"etag": etag, "hits": hits},
+            fetched_at=fetched_at,
+            expires_at=fetched_at + timedelta(hours=1),
+        )
+
+
+def _client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _search_key(request: httpx.Request) -> str:
+    return "comments" if "comment" in request.url.params["tags"] else "stories"
+
+
+# ── _fetch_hn_data_cached ────────────────────────────────────────────
+
+
+class TestFetchHnDataCached:
+    @pytest.mark.asyncio
+    async def test_fresh_entries_skip_requests(self, cache):
+        store, saved = cache
+        _store_hits(store, age=timedelta(minutes=10))
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise AssertionError(f"unexpected request to {request.url}")
+
+        async with _client(handler) as client:
+            comments, stories = await _fetch_hn_data_cached(client, "pg", "mini-1", FakeSession())
+
+        assert comments == [COMMENT]
+        assert stories == [STORY]
+        assert saved == []
+
+    @pytest.mark.asyncio
+    async def test_stale_entries_revalidated_with_etag(self, cache):
+        store, saved = cache
+        _store_hits(store, age=timedelta(hours=2))
+        etags: dict[str, str] = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            etags[_search_key(request)] = request.headers["If-None-Match"]
+            return httpx.Response(304)
+
+        async with _client(handler) as client:
+            comments, stories = await _fetch_hn_data_cached(client, "pg", "mini-1", FakeSession())
+
+        assert etags == {"comments": '"c1"', "stories": '"s1"'}
+        assert comments == [COMMENT]
+        assert stories == [STORY]
+        # 304s re-save the cached hits so their TTL restarts
+        assert sorted(saved) == [
+            ("comments:pg", {"etag": '"c1"', "hits": [COMMENT]}, 1),
+            ("stories:pg", {"etag": '"s1"', "hits": [STORY]}, 1),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stale_entries_replaced_on_change(self, cache):
+        store, saved = cache
+        _store_hits(store, age=timedelta(hours=2))
+        new_comment = {"objectID": "3", "comment_text": "new comment"}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if _search_key(request) == "comments":
+                return httpx.Response(200, json={"hits": [new_comment]}, headers={"ETag": '"c2"'})
+            return httpx.Response(304)
+
+        async with _client(handler) as client:
+            comments, stories = await _fetch_hn_data_cached(client, "pg", "mini-1", FakeSession())
+
+        assert comments == [new_comment]
+        assert stories == [STORY]
+        assert ("comments:pg", {"etag": '"c2"', "hits": [new_comment]}, 1) in saved
+
+    @pytest.mark.asyncio
+    async def test_missing_entries_fetched_unconditionally(self, cache):
+        _, saved = cache
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert "If-None-Match" not in request.headers
+            hits = [COMMENT] if _search_key(request) == "comments" else [STORY]
+            return httpx.Response(200, json={"hits": hits})
+
+        async with _client(handler) as client:
+            comments, stories = await _fetch_hn_data_cached(client, "pg", "mini-1", FakeSession())
+
+        assert comments == [COMMENT]
+        assert stories == [STORY]
+        assert len(saved) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_revalidation_serves_stale_hits(self, cache):
+        store, saved = cache
+        _store_hits(store, age=timedelta(hours=2))
+        new_story = {"objectID": "4", "title": "new story"}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if _search_key(request) == "comments":
+                return httpx.Response(503)
+            return httpx.Response(200, json={"hits": [new_story]}, headers={"ETag": '"s2"'})
+
+        async with _client(handler) as client:
+            comments, stories = await _fetch_hn_data_cached(client, "pg", "mini-1", FakeSession())
+
+        assert comments == [COMMENT]
+        assert stories == [new_story]
+        # Only the search that succeeded is re-saved
+        assert saved == [("stories:pg", {"etag": '"s2"', "hits": [new_story]}, 1)]
+
+    @pytest.mark.asyncio
+    async def test_cache_failures_do_not_abort_fetch(self, monkeypatch):
+        async def failing_cache(*args, **kwargs):
+            raise RuntimeError("db down")
+
+        monkeypatch.setattr(hackernews, "get_cached_entries", failing_cache)
+        monkeypatch.setattr(hackernews, "save_cache_many", failing_cache)
+        session = FakeSession()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            hits = [COMMENT] if _search_key(request) == "comments" else [STORY]
+            return httpx.Response(200, json={"hits": hits})
+
+        async with _client(handler) as client:
+            comments, stories = await _fetch_hn_data_cached(client, "pg", "mini-1", session)
+
+        assert comments == [COMMENT]
+        assert stories == [STORY]
+        assert session.rolled_back == 2
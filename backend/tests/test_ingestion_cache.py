@@ -0,0 +1,44 @@
+"""Tests for backend/app/plugins/ingestion_cache.py."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.plugins.ingestion_cache import save_cache_many
+from tests.conftest import FakeSession
+
+# ── save_cache_many ──────────────────────────────────────────────────
+
+
+class TestSaveCacheMany:
+    @pytest.mark.asyncio
+    async def test_single_upsert(self):
+        session = FakeSession()
+        await save_cache_many(session, "mini-1", "devblog", [("a", {"n": 1}, 24), ("b", {}, 1)])
+
+        (stmt,) = session.executed
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (mini_id, source_name, data_key) DO UPDATE" in sql
+
+    @pytest.mark.asyncio
+    async def test_duplicate_keys_collapsed_last_wins(self):
+        session = FakeSession()
+        await save_cache_many(
+            session,
+            "mini-1",
+            "devblog",
+            [("article:1", {"v": 1}, 24), ("article:2", {"v": 2}, 24), ("article:1", {"v": 3}, 24)],
+        )
+
+        (stmt,) = session.executed
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        rows = {params[f"data_key_m{i}"]: params[f"data_json_m{i}"] for i in range(2)}
+        assert rows == {"article:1": {"v": 3}, "article:2": {"v": 2}}
+        assert "data_key_m2" not in params
+
+    @pytest.mark.asyncio
+    async def test_no_entries_no_statement(self):
+        session = FakeSession()
+        await save_cache_many(session, "mini-1", "devblog", [])
+        assert session.executed == []
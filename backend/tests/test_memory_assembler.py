@@ -4,6 +4,13 @@ from __future__ import annotations
 
 import json
 
+from app.models.knowledge import (
+    KnowledgeEdge,
+    KnowledgeGraph,
+    KnowledgeNode,
+    NodeType,
+    RelationType,
+)
 from app.synthesis.memory_assembler import (
     _dedup_key,
     _extract_roles_keyword,
@@ -242,6 +249,21 @@ class TestAssembleMemory:
         result = assemble_memory([report])
         assert "# Unified Memory" in result
 
+    def test_brain_lists_outgoing_relations_by_node_name(self):
+        report = make_report()
+        report.knowledge_graph = KnowledgeGraph(
+            nodes=[
+                KnowledgeNode(id="rust", name="Rust", type=NodeType.LANGUAGE),
+                KnowledgeNode(id="ripgrep", name="ripgrep", type=NodeType.PROJECT),
+            ],
+            edges=[
+                KnowledgeEdge(source="rust", target="ripgrep", relation=RelationType.USED_IN),
+                KnowledgeEdge(source="rust", target="unknown-id", relation=RelationType.LOVES),
+            ],
+        )
+        result = assemble_memory([report])
+        assert "*Rel:* used_in -> ripgrep, loves -> unknown-id" in result
+
 
 # ── extract_values_json ──────────────────────────────────────────────
 
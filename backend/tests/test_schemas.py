@@ -0,0 +1,147 @@
+"""Tests for backend/app/models/schemas.py."""
+
+from __future__ import annotations
+
+import datetime
+import warnings
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.models.schemas import MiniDetail
+
+
+def make_mini_row(**overrides) -> SimpleNamespace:
+    """Stand-in for a Mini ORM row, read through from_attributes."""
+    now = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+    row = {
+        "id": "mini-1",
+        "username": "torvalds",
+        "display_name": "Linus Torvalds",
+        "avatar_url": None,
+        "owner_id": None,
+        "visibility": "public",
+        "org_id": None,
+        "bio": None,
+        "spirit_content": None,
+        "memory_content": None,
+        "system_prompt": None,
+        "metadata_json": None,
+        "sources_used": None,
+        "values_json": None,
+        "roles_json": None,
+        "skills_json": None,
+        "traits_json": None,
+        "status": "ready",
+        "created_at": now,
+        "updated_at": now,
+    }
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+VALUES = {
+    "engineering_values": [
+        {"name": "Simplicity", "description": "Prefers plain code", "intensity": 0.9},
+        {"name": "Speed"},
+    ]
+}
+EXPECTED_VALUES = [
+    {"name": "Simplicity", "description": "Prefers plain code", "intensity": 0.9},
+    {"name": "Speed", "description": "", "intensity": 0.5},
+]
+
+
+# ── MiniDetail JSON columns ──────────────────────────────────────────
+
+
+class TestMiniDetailJsonColumns:
+    def test_decodes_json_strings(self):
+        detail = MiniDetail.model_validate(
+            make_mini_row(
+                values_json='{"engineering_values": [{"name": "Simplicity", '
+                '"description": "Prefers plain code", "intensity": 0.9}, {"name": "Speed"}]}',
+                roles_json='{"primary": "maintainer"}',
+                skills_json='["c", "git"]',
+                traits_json='["direct"]',
+            )
+        )
+        assert detail.values == EXPECTED_VALUES
+        assert detail.roles == {"primary": "maintainer"}
+        assert list(detail.skills) == ["c", "git"]
+        assert list(detail.traits) == ["direct"]
+
+    def test_accepts_decoded_columns(self):
+        detail = MiniDetail.model_validate(
+            make_mini_row(
+                values_json=VALUES,
+                roles_json={"primary": "maintainer"},
+                skills_json=["c", "git"],
+                traits_json=["direct"],
+            )
+        )
+        assert detail.values == EXPECTED_VALUES
+        assert detail.roles == {"primary": "maintainer"}
+        assert list(detail.skills) == ["c", "git"]
+        assert list(detail.traits) == ["direct"]
+
+    def test_malformed_json_falls_back_to_empty(self):
+        detail = MiniDetail.model_validate(
+            make_mini_row(
+                values_json="{not json",
+                roles_json="{not json",
+                skills_json="[unterminated",
+                traits_json="nope",
+            )
+        )
+        assert detail.values == []
+        assert detail.roles == {}
+        assert list(detail.skills) == []
+        assert list(detail.traits) == []
+
+    def test_none_columns_fall_back_to_empty(self):
+        detail = MiniDetail.model_validate(make_mini_row())
+        assert detail.values == []
+        assert detail.roles == {}
+        assert list(detail.skills) == []
+        assert list(detail.traits) == []
+
+    def test_values_without_engineering_values(self):
+        detail = MiniDetail.model_validate(make_mini_row(values_json='["not", "a", "dict"]'))
+        assert detail.values == []
+
+    def test_raw_columns_not_in_response(self):
+        dumped = MiniDetail.model_validate(make_mini_row(skills_json=["c"])).model_dump()
+        assert {"values", "roles", "skills", "traits"} <= dumped.keys()
+        assert not {"values_json", "roles_json", "skills_json", "traits_json"} & dumped.keys()
+
+    def test_string_lists_serialize_without_warnings(self):
+        detail = MiniDetail.model_validate(
+            make_mini_row(skills_json='["c", "git"]', traits_json=["direct"])
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            dumped = detail.model_dump(mode="json")
+        assert dumped["skills"] == ["c", "git"]
+        assert dumped["traits"] == ["direct"]
+
+    def test_validation_opt_in_drops_bad_shapes(self, monkeypatch):
+        monkeypatch.setattr(settings, "validate_cached_json", True)
+        detail = MiniDetail.model_validate(
+            make_mini_row(
+                values_json=VALUES,
+                roles_json={"primary": "maintainer"},
+                skills_json=[{"not": "a string"}],
+                traits_json=["direct"],
+            )
+        )
+        assert detail.values == EXPECTED_VALUES
+        assert detail.roles == {"primary": "maintainer"}
+        assert list(detail.skills) == []
+        assert list(detail.traits) == ["direct"]
+
+    def test_model_is_frozen(self):
+        detail = MiniDetail.model_validate(make_mini_row())
+        with pytest.raises(ValueError):
+            detail.username = "someone-else"
@@ -0,0 +1,215 @@
+"""Tests for backend/app/core/usage_buffer.py."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Self
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import app.db
+from app.core import usage_buffer as usage_buffer_module
+from app.core.usage_buffer import UsageEventBuffer, _write_batch
+
+
+def make_event(user_id: str | None = "user-1", cost_usd: float = 0.5) -> dict:
+    return {
+        "user_id": user_id,
+        "model": "gemini-2.5-flash",
+        "input_tokens": 100,
+        "output_tokens": 50,
+        "total_tokens": 150,
+        "cost_usd": cost_usd,
+        "endpoint": "llm_completion",
+        "error": None,
+    }
+
+
+class FakeResult:
+    def __init__(self, rows: list[tuple]) -> None:
+        self._rows = rows
+
+    def all(self) -> list[tuple]:
+        return self._rows
+
+    def one(self) -> tuple:
+        return self._rows[0]
+
+
+class FakeSession:
+    """Records executed statements; upserts return the configured rows."""
+
+    def __init__(self, user_rows: list[tuple], global_row: tuple) -> None:
+        self.user_rows = user_rows
+        self.global_row = global_row
+        self.executed: list[tuple] = []
+        self.committed = False
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    async def execute(self, stmt, params=None) -> FakeResult:
+        self.executed.append((stmt, params))
+        table = stmt.table.name
+        if table == "user_budgets":
+            return FakeResult(self.user_rows)
+        if table == "global_budget":
+            return FakeResult([self.global_row])
+        return FakeResult([])
+
+    async def commit(self) -> None:
+        self.committed = True
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    session = FakeSession(user_rows=[], global_row=(1.0, 100.0))
+    monkeypatch.setattr(app.db, "async_session", lambda: session)
+    return session
+
+
+def _compiled(stmt) -> tuple[str, dict]:
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+# ── _write_batch ─────────────────────────────────────────────────────
+
+
+class TestWriteBatch:
+    @pytest.mark.asyncio
+    async def test_inserts_events_in_one_executemany(self, fake_session):
+        batch = [make_event(), make_event("user-2"), make_event(None)]
+        await _write_batch(batch)
+
+        stmt, params = fake_session.executed[0]
+        assert stmt.table.name == "llm_usage_events"
+        assert params == batch
+        assert fake_session.committed
+
+    @pytest.mark.asyncio
+    async def test_user_budget_upsert_sums_per_user(self, fake_session):
+        await _write_batch(
+            [make_event("user-1", 0.25), make_event("user-2", 1.0), make_event("user-1", 0.5)]
+        )
+
+        stmt, _ = fake_session.executed[1]
+        sql, params = _compiled(stmt)
+        assert stmt.table.name == "user_budgets"
+        assert "ON CONFLICT (user_id) DO UPDATE" in sql
+        assert "user_budgets.total_spent_usd + excluded.total_spent_usd" in sql
+        values = {params[f"user_id_m{i}"]: params[f"total_spent_usd_m{i}"] for i in range(2)}
+        assert values == {"user-1": 0.75, "user-2": 1.0}
+
+    @pytest.mark.asyncio
+    async def test_global_budget_upsert_includes_anonymous_spend(self, fake_session):
+        await _write_batch([make_event("user-1", 0.25), make_event(None, 2.0)])
+
+        stmt, _ = fake_session.executed[-1]
+        sql, params = _compiled(stmt)
+        assert stmt.table.name == "global_budget"
+        assert "ON CONFLICT (key) DO UPDATE" in sql
+        assert params["key"] == "global"
+        assert params["total_spent_usd"] == 2.25
+
+    @pytest.mark.asyncio
+    async def test_skips_user_upsert_without_users(self, fake_session):
+        await _write_batch([make_event(None)])
+
+        tables = [stmt.table.name for stmt, _ in fake_session.executed]
+        assert tables == ["llm_usage_events", "global_budget"]
+
+    @pytest.mark.asyncio
+    async def test_alerts_at_threshold(self, fake_session, monkeypatch):
+        alerts = []
+        monkeypatch.setattr(
+            "app.core.alerts.alert_budget_threshold", lambda *args: alerts.append(args)
+        )
+        monkeypatch.setattr(
+            "app.core.alerts.alert_global_threshold", lambda *args: alerts.append(args)
+        )
+        fake_session.user_rows = [("user-1", 9.0, 10.0), ("user-2", 1.0, 10.0)]
+        fake_session.global_row = (50.0, 100.0)
+
+        await _write_batch([make_event("user-1"), make_event("user-2")])
+
+        assert alerts == [("user-1", 9.0, 10.0, 0.9)]
+
+
+# ── UsageEventBuffer ─────────────────────────────────────────────────
+
+
+@pytest.fixture
+def written(monkeypatch):
+    batches: list[list[dict]] = []
+
+    async def fake_write_batch(batch):
+        batches.append(batch)
+
+    monkeypatch.setattr(usage_buffer_module, "_write_batch", fake_write_batch)
+    return batches
+
+
+async def _until(condition) -> None:
+    while not condition():
+        await asyncio.sleep(0)
+
+
+class TestUsageEventBuffer:
+    @pytest.mark.asyncio
+    async def test_close_drains_pending_events(self, written):
+        buffer = UsageEventBuffer(interval=60, batch_size=2)
+        buffer.start()
+        for _ in range(5):
+            buffer.add(make_event())
+
+        await buffer.close()
+
+        assert [len(batch) for batch in written] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_wakes_flusher(self, written):
+        buffer = UsageEventBuffer(interval=60, batch_size=2)
+        buffer.start()
+        try:
+            buffer.add(make_event())
+            buffer.add(make_event())
+            # Well under the 60s interval: only the full batch can trigger this flush
+            await asyncio.wait_for(_until(lambda: written), timeout=1)
+        finally:
+            await buffer.close()
+
+        assert [len(batch) for batch in written] == [2]
+
+    @pytest.mark.asyncio
+    async def test_add_without_flusher_writes_directly(self, written):
+        buffer = UsageEventBuffer(interval=60, batch_size=10)
+        buffer.add(make_event())
+        buffer.add(make_event())
+
+        await asyncio.sleep(0)
+
+        assert [len(batch) for batch in written] == [2]
+
+    def test_add_without_event_loop_keeps_event_queued(self, written):
+        buffer = UsageEventBuffer()
+        buffer.add(make_event())
+
+        asyncio.run(buffer.close())
+
+        assert [len(batch) for batch in written] == [1]
+
+    @pytest.mark.asyncio
+    async def test_write_failure_is_logged_not_raised(self, monkeypatch):
+        async def failing_write_batch(batch):
+            raise RuntimeError("db down")
+
+        monkeypatch.setattr(usage_buffer_module, "_write_batch", failing_write_batch)
+        buffer = UsageEventBuffer()
+        buffer.add(make_event())
+
+        await buffer.close()